@@ -4,9 +4,10 @@ __version__ = '0.1.8'
 __author__ = 'Tim'
 __email__ = 'tim@skripe.com'
 
-from .core import TenantDeleter, TenantWiperConfig
+from .core import TenantColumnFilter, TenantDeleter, TenantWiperConfig
 
 __all__ = [
     'TenantWiperConfig',
     'TenantDeleter',
+    'TenantColumnFilter',
 ]
@@ -1,27 +1,86 @@
+import array
+import functools
 import inspect
-import itertools
 import logging
 import pprint
+import re
+import threading
 import traceback
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from time import perf_counter
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
-from unittest.mock import Mock
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
 
-from sqlalchemy import literal, or_, select, tuple_, union
+from sqlalchemy import Integer, bindparam, column, func, literal, or_, select, tuple_, union, union_all
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
-from sqlalchemy.schema import Table
+from sqlalchemy.schema import Column, MetaData, Table
+from sqlalchemy.sql.elements import ColumnClause
 
 logger = logging.getLogger(__name__)
+
+# Join path name token: anything without '=' or a double underscore, same tokens as str.split('__')
+_JOIN_TOKEN = r'(?:[^_=]|_(?!_))+'
+_JOIN_PATH_RE = re.compile(rf'{_JOIN_TOKEN}(?:__{_JOIN_TOKEN}={_JOIN_TOKEN}__{_JOIN_TOKEN})*')
+_JOIN_STEP_RE = re.compile(rf'__({_JOIN_TOKEN})=({_JOIN_TOKEN})__({_JOIN_TOKEN})')
+
+# Bind parameter limits per statement of dialects where a DELETE batch or fused count can exceed them:
+# SQLite's historical limit of 999, and SQL Server's 2100
+_MAX_BIND_PARAMS = {'sqlite': 999, 'mssql': 2100}
+
+# Operators of a TenantColumnFilter
+_COLUMN_FILTER_OPS = ('eq', 'in_')
+
+# Dry run modes accepted by TenantDeleter.delete
+_DRY_RUN_MODES = ('count', 'compile')
+
+# Tables counted per fused dry-run SELECT, keeps the statement size bounded on large schemas
+_COUNT_TABLES_PER_QUERY = 100
+
+
+class _JoinStep(NamedTuple):
+    """One `from_key=to_key` hop of a join path."""
+    from_table: str
+    from_key: str
+    to_table: str
+    to_key: str
+
+
+class _ParsedJoinPath(NamedTuple):
+    """Immutable parse result of a join path, safe to share between configs."""
+    start_table: str
+    final_table: str
+    steps: Tuple[_JoinStep, ...]
+
+
+@functools.lru_cache(maxsize=1024)
+def _placeholder_column(column_name: str) -> ColumnClause:
+    """Typeless column expression standing in for a column the probed table does not have."""
+    return column(column_name)
+
+
 class ColumnRecorder:
     """Records column access for tenant filter validation."""
 
-    def __init__(self):
+    def __init__(self, table_columns=None):
         self.accessed_columns = set()
+        self._table_columns = table_columns
+
+    def reset(self, table_columns=None):
+        """Forget recorded columns so the recorder can be reused for another probe of `table_columns`."""
+        self.accessed_columns.clear()
+        self._table_columns = table_columns
 
     def __getattr__(self, column_name):
         self.accessed_columns.add(column_name)
-        return Mock()  # Return mock for any method calls (in_, ==, etc.)
+        # Real SQLAlchemy expressions, so and_(), or_(), func.* and type specific operators coerce as usual
+        if self._table_columns is not None and column_name in self._table_columns:
+            return self._table_columns[column_name]
+        return _placeholder_column(column_name)
+
+    def __getitem__(self, column_name):
+        return self.__getattr__(column_name)
+
 
 class TableProxy:
     """
@@ -30,11 +89,11 @@ class TableProxy:
     It intercepts access to the '.c' attribute to return a ColumnRecorder,
     but passes all other attribute access through to the real table.
     """
-    def __init__(self, real_table):
+    def __init__(self, real_table, recorder: Optional[ColumnRecorder] = None):
         self._real_table = real_table
         # Instead of replacing .c on the real table, we create our own .c
         # that points to our recorder.
-        self.c = ColumnRecorder()
+        self.c = recorder if recorder is not None else ColumnRecorder()
 
     def __getattr__(self, name):
         return getattr(self._real_table, name)
@@ -43,35 +102,131 @@ class TableProxy:
         return f'<TableProxy for {self._real_table.name}>'
 
 
+# Recorder and proxy reused by every filter probe of a thread, probes run one at a time per thread
+_probe_local = threading.local()
+
+
+def _get_probe_proxy(table: Table) -> TableProxy:
+    """Return this thread's reusable TableProxy pointed at `table` with a freshly reset recorder."""
+    proxy = getattr(_probe_local, 'proxy', None)
+    if proxy is None:
+        proxy = _probe_local.proxy = TableProxy(table)
+    proxy._real_table = table
+    proxy.c.reset(table.c)
+    return proxy
+
+
+class TenantColumnFilter:
+    """
+    Declarative tenant filter on a single column.
+
+    `op` is 'eq' for equality or 'in_' for IN. The column is known up front, so applicability
+    is a column lookup instead of a recorded filter call.
+    """
+    __slots__ = ('column', 'op', 'value')
+
+    def __init__(self, column: str, op: str, value: Any):
+        if op not in _COLUMN_FILTER_OPS:
+            raise ValueError(f"TenantColumnFilter op must be one of {_COLUMN_FILTER_OPS}, got '{op}'")
+        if op == 'in_' and isinstance(value, (str, bytes)):
+            raise ValueError(f"TenantColumnFilter op 'in_' needs a collection of values, got {value!r}")
+        self.column = column
+        self.op = op
+        self.value = list(value) if op == 'in_' else value
+
+    def __call__(self, table: Table) -> Any:
+        column = table.c[self.column]
+        if self.op == 'in_':
+            return column.in_(self.value)
+        return column == self.value
+
+    def __repr__(self):
+        return f'TenantColumnFilter({self.column!r}, {self.op!r}, {self.value!r})'
+
+
+TenantFilter = Union[Callable[[Table], Any], TenantColumnFilter, Tuple[str, Any]]
+
+
+def _as_tenant_filter(tenant_filter: TenantFilter) -> Callable[[Table], Any]:
+    """
+    Turn a `(column_name, value)` tuple into a TenantColumnFilter, callables are returned as is.
+
+    List, tuple and set values filter with IN, anything else with equality.
+    """
+    if isinstance(tenant_filter, tuple):
+        if len(tenant_filter) != 2:
+            raise ValueError(
+                f'Tuple tenant filters take the form (column_name, value), got {tenant_filter!r}. '
+                'Use TenantColumnFilter(column, op, value) to pass an operator.'
+            )
+        column, value = tenant_filter
+        op = 'in_' if isinstance(value, (list, tuple, set, frozenset)) else 'eq'
+        return TenantColumnFilter(column, op, value)
+    return tenant_filter
+
+
+def _count_bind_params(statement: Any) -> int:
+    """Number of bind parameters a statement renders, expanding IN parameters count once per value."""
+    return sum(
+        len(value) if isinstance(value, (list, tuple)) else 1
+        for value in statement.compile().params.values()
+    )
+
+
 class TenantWiperConfig:
     """Configuration for tenant data wiping with flexible Base and filtering."""
 
     def __init__(
         self,
         base,
-        tenant_filters: Optional[List[Callable[[Table], Any]]] = None,
+        tenant_filters: Optional[List[TenantFilter]] = None,
         tenant_join_paths: Optional[List[str]] = None,
         excluded_tables: Optional[List[str]] = None,
         validate_on_init: bool = True,
-        batch_size: Optional[int] = 500
+        batch_size: Optional[int] = 500,
+        parallelism: int = 1,
+        stage_pks_in_temp_tables: bool = False
     ):
         """
         Initialize tenant wiper configuration.
 
         Args:
             base: SQLAlchemy declarative Base
-            tenant_filters: List of lambda expressions for tenant filtering
+            tenant_filters: List of lambda expressions or `(column_name, value)` tuples for tenant filtering
             tenant_join_paths:  Defines explicit join paths for tables that indirectly belong to a tenant.
-            excluded_tables: List of table names to exclude from deletion
+            excluded_tables: Table names to exclude from deletion (stored as a read-only tuple)
             validate_on_init: Whether to validate configuration on initialization
+            batch_size: Number of rows fetched and deleted per round-trip, DELETE batches are shrunk
+                on SQLite and SQL Server to stay under their bind parameter limit
+            parallelism: Number of threads running PK collection queries concurrently
+            stage_pks_in_temp_tables: Snapshot PKs into temporary tables instead of fetching them
         """
         self.base = base
-        self.tenant_filters = tenant_filters if tenant_filters is not None else []
+        self.tenant_filters = [_as_tenant_filter(f) for f in tenant_filters] if tenant_filters is not None else []
         self.relationships = tenant_join_paths if tenant_join_paths is not None else []
-        self.excluded_tables = excluded_tables if excluded_tables is not None else []
+        # Stored read-only: the excluded set and deletable tables are cached from it below
+        self.excluded_tables: Tuple[str, ...] = tuple(excluded_tables) if excluded_tables is not None else ()
+        self._excluded_tables_set: FrozenSet[str] = frozenset(self.excluded_tables)
         self.validate_on_init = validate_on_init
         self.batch_size = batch_size
-
+        if parallelism < 1:
+            raise ValueError(f'parallelism must be at least 1, got {parallelism}')
+        self.parallelism = parallelism
+        self.stage_pks_in_temp_tables = stage_pks_in_temp_tables
+
+        # Memoized filter applicability per (table, filter) pair, shared by validation and deletion
+        self._filter_cache: Dict[Tuple[int, int], Tuple[bool, Set[str]]] = {}
+        # (table, filter) pairs whose expression already compiled during validation
+        self._compiled_filter_pairs: Set[Tuple[int, int]] = set()
+        # Tenant filters applicable to each table name, filled lazily or by validate()
+        self._applicable_filters_per_table: Dict[str, List[Callable[[Table], Any]]] = {}
+        # Applicable filters of each table name built and OR-ed into one expression, None if none applies
+        self._compiled_filters: Dict[str, Optional[Any]] = {}
+        # Set once validate() passed, the configuration is not changed after init
+        self._validated = False
+
+        # Parsed join paths by path string; malformed paths are left out and reported by validate()
+        self._parsed_relationships: Dict[str, _ParsedJoinPath] = {}
         # Parse relationships into lookup dict
         self._relationship_dict: Dict[str, List[str]] = self._parse_relationships()
 
@@ -86,15 +241,53 @@ class TenantWiperConfig:
             if source_table not in relationship_dict:
                 relationship_dict[source_table] = []
             relationship_dict[source_table].append(relationship_str)
+            try:
+                self._parsed_relationships[relationship_str] = _parse_join_path(relationship_str)
+            except ValueError:
+                pass
         return relationship_dict
 
+    def _get_parsed_path(self, relationship_path: str) -> _ParsedJoinPath:
+        """
+        Returns the parsed join path, parsed once at init for configured paths.
+
+        Raises:
+            ValueError: Path is malformed
+        """
+        parsed_path = self._parsed_relationships.get(relationship_path)
+        if parsed_path is None:
+            parsed_path = _parse_join_path(relationship_path)
+        return parsed_path
+
+
+    @functools.cached_property
+    def _deletion_order(self) -> Tuple[Table, ...]:
+        """
+        Tables sorted for safe deletion (dependencies first).
+
+        metadata.sorted_tables runs a topological sort on every access, so the order is computed
+        once per config and shared by every TenantDeleter built from it.
+        """
+        return tuple(reversed(self.base.metadata.sorted_tables))
+
+    @functools.cached_property
+    def _deletable_tables(self) -> Tuple[Table, ...]:
+        """Deletion order without explicitly excluded tables."""
+        return tuple(table for table in self._deletion_order if table.name not in self._excluded_tables_set)
 
     def validate(self) -> None:
-        """Validate configuration for correctness."""
+        """
+        Validate configuration for correctness.
+
+        Validation runs once, calls after a successful validation return right away.
+        """
+        if self._validated:
+            return
         logger.info('[Tenant Wiper] Validating table declarations and configuration...')
         metadata = self.base.metadata
-        excluded_tables_set = set(self.excluded_tables)
+        excluded_tables_set = self._excluded_tables_set
         relationship_errors = []
+        all_columns = _build_columns_index(metadata)
 
         # Validate relationship paths
         for source_table, relationship_paths in self._relationship_dict.items():
@@ -107,7 +300,11 @@ class TenantWiperConfig:
 
             # Validate all paths for this table
             for relationship_path in relationship_paths:
-                path_errors = _validate_relationship_path(relationship_path, metadata, self.tenant_filters)
+                path_errors = _validate_relationship_path(
+                    relationship_path, metadata, self.tenant_filters,
+                    self._filter_cache, self._compiled_filter_pairs, all_columns,
+                    self._parsed_relationships.get(relationship_path)
+                )
                 if path_errors:
                     relationship_errors.extend([
                         f"Relationship '{source_table}' path '{relationship_path}': {error}"
@@ -118,61 +315,131 @@ class TenantWiperConfig:
             raise ValueError(error_msg)
 
         # Validate table coverage
-        tables_with_no_coverage = []
         sorted_tables = metadata.sorted_tables
-        implicit_direct_relationships = 0
 
-        for table in sorted_tables:
-            table_name = table.name
-            if table_name in excluded_tables_set:
-                logging.info(f'[Tenant Wiper] Skipped "{table_name}" because in excluded table set')
-                continue
-
-            has_tenant_filter = self._has_tenant_column(table)
-            if has_tenant_filter:
-                implicit_direct_relationships += 1
-
-            if has_tenant_filter and table_name in self._relationship_dict:
-                logger.warning(
-                    f"Table '{table_name}' can be directly filtered by tenant filters "
-                    f"but also has an entry in relationships. "
-                    f"Please ensure this is intentional."
-                )
+        skipped_tables = [table.name for table in sorted_tables if table.name in excluded_tables_set]
+        if skipped_tables:
+            logger.info('[Tenant Wiper] Skipped %s because in excluded table set', skipped_tables)
+        covered_tables = [table for table in sorted_tables if table.name not in excluded_tables_set]
+
+        # A table is covered by a direct tenant filter or by a relationship path
+        directly_filtered = {
+            table.name for table in covered_tables if self._has_tenant_column(table, validate_compile=True)
+        }
+        implicit_direct_relationships = len(directly_filtered)
+        for table_name in sorted(directly_filtered.intersection(self._relationship_dict)):
+            logger.warning(
+                "Table '%s' can be directly filtered by tenant filters "
+                "but also has an entry in relationships. "
+                "Please ensure this is intentional.",
+                table_name
+            )
 
-            if not has_tenant_filter and table_name not in self._relationship_dict:
-                tables_with_no_coverage.append(table_name)
+        uncovered = {table.name for table in covered_tables} - directly_filtered - self._relationship_dict.keys()
+        # Keep the error listing in table order
+        tables_with_no_coverage = [table.name for table in covered_tables if table.name in uncovered]
 
         if tables_with_no_coverage:
             error_msg = f'Cannot apply tenant filter: The following tables lack the necessary tenant columns'\
                         f' or a defined relationship path to tenant source (e.g., "table__from_pk=to_pk__tenantsrc): {tables_with_no_coverage}'  # noqa
-            pprint.pprint(self._relationship_dict)
+            # Walk the foreign key graph once to propose the shortest path to a filtered table
+            fk_graph = _build_fk_graph(metadata)
+            suggestions = {}
+            for table_name in tables_with_no_coverage:
+                suggestion = _suggest_join_path(table_name, directly_filtered, fk_graph)
+                if suggestion:
+                    suggestions[table_name] = suggestion
+            if suggestions:
+                error_msg += '\nSuggested relationship paths (via foreign keys):\n' + '\n'.join(
+                    f"  '{table_name}': ['{suggestion}']" for table_name, suggestion in suggestions.items()
+                )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('[Tenant Wiper] Declared relationship paths:\n%s', pprint.pformat(self._relationship_dict))
             raise ValueError(error_msg)
 
+        # Build the filter expressions up front so deletions don't invoke the filter lambdas
+        for table in covered_tables:
+            self._get_filter_expression(table)
+
         logger.info(
-            f'Tenant wiper validation passed:\n  {len(metadata.sorted_tables)} tables checked. '
-            f'\n  {len(self._relationship_dict)} table relationships validated. '
-            f'\n  {implicit_direct_relationships} tables have direct tenant filters. '
-            f'\n  {len(excluded_tables_set)} tables explicitly excluded.'
+            'Tenant wiper validation passed:\n  %d tables checked. '
+            '\n  %d table relationships validated. '
+            '\n  %d tables have direct tenant filters. '
+            '\n  %d tables explicitly excluded.',
+            len(sorted_tables), len(self._relationship_dict),
+            implicit_direct_relationships, len(excluded_tables_set)
         )
+        self._validated = True
 
-    def _has_tenant_column(self, table: Table) -> bool:
-        """Check if any tenant filter can be applied to this table."""
-        for tenant_filter in self.tenant_filters:
-            try:
-                can_apply, _ = _can_apply_tenant_filter(table, tenant_filter)
-                if can_apply:
-                    return True
-            except ValueError:
-                # Syntax error - re-raise to surface the issue
-                raise
-        return False
+    def _has_tenant_column(self, table: Table, validate_compile: bool = False) -> bool:
+        """
+        Check if any tenant filter can be applied to this table.
 
+        Args:
+            table: Table to check
+            validate_compile: Also compile each applicable filter once to surface expression errors
+        """
+        applicable_filters = self._get_applicable_filters(table)
+        if validate_compile:
+            for tenant_filter in applicable_filters:
+                _can_apply_tenant_filter(table, tenant_filter, self._filter_cache, self._compiled_filter_pairs)
+        return bool(applicable_filters)
 
-def _parse_join_path(path: str) -> Dict[str, Any]:
+    def _get_applicable_filters(self, table: Table) -> List[Callable[[Table], Any]]:
+        """
+        Return the tenant filters that can be applied to this table, computed once per table.
+
+        Raises:
+            ValueError: A filter has syntax/expression errors
+        """
+        applicable_filters = self._applicable_filters_per_table.get(table.name)
+        if applicable_filters is None:
+            applicable_filters = [
+                tenant_filter for tenant_filter in self.tenant_filters
+                if _check_filter_applies(table, tenant_filter, self._filter_cache)[0]
+            ]
+            self._applicable_filters_per_table[table.name] = applicable_filters
+        return applicable_filters
+
+    def _get_filter_expression(self, table: Table) -> Optional[Any]:
+        """
+        Return the applicable tenant filters of this table combined with OR, built once per table.
+
+        SQLAlchemy expressions are immutable, so the same expression is reused by every query.
+        Returns None if no filter applies to the table.
+        """
+        if table.name in self._compiled_filters:
+            return self._compiled_filters[table.name]
+
+        filter_expressions = [f(table) for f in self._get_applicable_filters(table)]
+        if not filter_expressions:
+            filter_expression = None
+        elif len(filter_expressions) == 1:
+            filter_expression = filter_expressions[0]
+        else:
+            filter_expression = or_(*filter_expressions)
+        self._compiled_filters[table.name] = filter_expression
+        return filter_expression
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_join_path(path: str) -> _ParsedJoinPath:
     """
     Parses a string like 'table1__fk=pk__table2__fk2=pk2__table3'
-    into a structured dictionary containing the start table and join steps.
+    into the start table, final table and join steps.
+
+    The result is immutable, so repeated parses of the same path are served from the cache.
     """
+    if _JOIN_PATH_RE.fullmatch(path):
+        start_table = path.split('__', 1)[0]
+        join_steps = []
+        from_table_name = start_table
+        for from_key, to_key, to_table_name in _JOIN_STEP_RE.findall(path, len(start_table)):
+            join_steps.append(_JoinStep(from_table_name, from_key, to_table_name, to_key))
+            from_table_name = to_table_name
+        return _ParsedJoinPath(start_table, from_table_name, tuple(join_steps))
+
+    # Not a well-formed path, split it up to report what exactly is wrong
     parts = path.split('__')
     if len(parts) % 2 == 0:
         raise ValueError(f"Malformed join path '{path}': Must have an odd number of parts.")
@@ -180,14 +447,9 @@ def _parse_join_path(path: str) -> Dict[str, Any]:
     start_table = parts[0]
     join_steps = []
 
-    iterator = iter(parts[1:])
-    step_pairs = itertools.zip_longest(iterator, iterator)
-
+    # The parity check above guarantees every condition is followed by a table
     from_table_name = start_table
-    for condition, to_table_name in step_pairs:
-        if condition is None or to_table_name is None:
-            raise ValueError(f"Incomplete join step in path '{path}'")
-
+    for condition, to_table_name in zip(parts[1::2], parts[2::2]):
         try:
             from_key, to_key = condition.split('=')
         except ValueError:
@@ -195,19 +457,10 @@ def _parse_join_path(path: str) -> Dict[str, Any]:
                 f"Invalid join condition format '{condition}' in path '{path}'. Expected 'from_key=to_key'."
             )
 
-        join_steps.append({
-            'from_table': from_table_name,
-            'from_key': from_key,
-            'to_table': to_table_name,
-            'to_key': to_key,
-        })
+        join_steps.append(_JoinStep(from_table_name, from_key, to_table_name, to_key))
         from_table_name = to_table_name
 
-    return {
-        'start_table': start_table,
-        'final_table': from_table_name,
-        'steps': join_steps
-    }
+    return _ParsedJoinPath(start_table, from_table_name, tuple(join_steps))
 
 
 def _get_model_class_for_table(table_name: str, base) -> Optional[type]:
@@ -215,71 +468,122 @@ def _get_model_class_for_table(table_name: str, base) -> Optional[type]:
     Find the SQLAlchemy model class for a given table name by looking through Base registry.
     Returns None if no model class is found.
     """
-    try:
-        if hasattr(base, 'registry'):
-            for mapper in base.registry.mappers:
-                if mapper.class_.__tablename__ == table_name:
-                    return mapper.class_
-    except (AttributeError, KeyError):
-        pass
+    registry = getattr(base, 'registry', None)
+    if registry is None:
+        return None
+    for mapper in registry.mappers:
+        if getattr(mapper.class_, '__tablename__', None) == table_name:
+            return mapper.class_
     return None
 
 
-def _get_all_columns_for_table(table_name: str, metadata, base) -> Set[str]:
-    """
-    Get all columns for a table, including inherited columns from model classes.
-    Falls back to metadata columns if no model class is found.
-    """
-    model_class = _get_model_class_for_table(table_name, base)
-    if model_class:
-        try:
-            mapper = model_class.__mapper__
-            return set(mapper.columns.keys())
-        except AttributeError:
-            pass
+def _build_columns_index(metadata) -> Dict[str, FrozenSet[str]]:
+    """Map every table name in metadata to the frozenset of its column names."""
+    return {name: frozenset(table.columns.keys()) for name, table in metadata.tables.items()}
 
-    if table_name in metadata.tables:
-        return set(metadata.tables[table_name].columns.keys())
 
-    return set()
+def _build_fk_graph(metadata) -> Dict[str, List[Tuple[str, str, str]]]:
+    """
+    Build an adjacency list of the foreign keys in metadata.
+
+    Every foreign key contributes an edge in both directions so paths can walk from child to parent
+    and from parent to child. Edges are ``(from_col, to_table, to_col)``.
+    """
+    graph: Dict[str, List[Tuple[str, str, str]]] = defaultdict(list)
+    for table in metadata.sorted_tables:
+        for fk in table.foreign_keys:
+            target = fk.column
+            graph[table.name].append((fk.parent.name, target.table.name, target.name))
+            graph[target.table.name].append((target.name, table.name, fk.parent.name))
+    return graph
+
+
+def _suggest_join_path(start: str, targets: Set[str], graph: Dict[str, List[Tuple[str, str, str]]],
+                       max_depth: int = 4) -> Optional[str]:
+    """Breadth-first search for the shortest foreign key path from start to any target table."""
+    if not targets:
+        return None
+    parents: Dict[str, Optional[Tuple[str, str, str]]] = {start: None}
+    frontier = [start]
+    for _ in range(max_depth):
+        next_frontier = []
+        for table_name in frontier:
+            for from_col, to_table, to_col in graph.get(table_name, ()):
+                if to_table in parents:
+                    continue
+                parents[to_table] = (table_name, from_col, to_col)
+                if to_table in targets:
+                    # Rebuild the path string back to front
+                    parts = [to_table]
+                    node = to_table
+                    while parents[node] is not None:
+                        prev, prev_col, node_col = parents[node]
+                        parts.append(f'{prev_col}={node_col}')
+                        parts.append(prev)
+                        node = prev
+                    return '__'.join(reversed(parts))
+                next_frontier.append(to_table)
+        frontier = next_frontier
+    return None
 
 
-def _can_apply_tenant_filter(table: Table, tenant_filter: Callable[[Table], Any]) -> Tuple[bool, Set[str]]:
+def _check_filter_applies(table: Table, tenant_filter: Callable[[Table], Any],
+                          cache: Optional[Dict[Tuple[int, int], Tuple[bool, Set[str]]]] = None
+                          ) -> Tuple[bool, Set[str]]:
     """
-    Check if table can be filtered by the given tenant filter directly.
+    Check if the table has all columns the given tenant filter accesses.
+
+    Only records column access, nothing is compiled. When a cache dict is given, the result
+    is memoized per (table, filter) pair.
 
     Returns:
         bool, Set[str]: True if filter can be applied, and a set of accessed columns.
-
-    Raises:
-        ValueError: Filter has syntax/expression errors
     """
-    # Record column access with mock
-    recorder = ColumnRecorder()
-    mock_table = TableProxy(table)
-    mock_table.c = recorder
+    if cache is not None:
+        cache_key = (id(table), id(tenant_filter))
+        cached = cache.get(cache_key)
+        if cached is None:
+            cached = cache[cache_key] = _check_filter_applies(table, tenant_filter)
+        return cached
+
+    if isinstance(tenant_filter, TenantColumnFilter):
+        # Declared column, nothing to record
+        accessed_columns = {tenant_filter.column}
+        return tenant_filter.column in table.c, accessed_columns
+
+    # Record column access with the thread's reusable proxy
+    mock_table = _get_probe_proxy(table)
 
     try:
         tenant_filter(mock_table)
-    except Exception as e:
-        # Even mock failed - syntax error
-        raise ValueError(f'Filter syntax error: {e}')
+    except Exception:
+        # Broken expression, keep the columns recorded up to the error. If the table has them, the
+        # compile check builds the filter again and reports the error together with the filter source
+        pass
 
+    # Copy out, the recorder is reset by the next probe
+    accessed_columns = set(mock_table.c.accessed_columns)
     # Check if accessed columns exist in real table
-    missing_columns = [col for col in recorder.accessed_columns
-                     if col not in table.c]
-    if missing_columns:
-        return False, recorder.accessed_columns  # Table doesn't have required columns
+    missing_columns = accessed_columns.difference(table.c.keys())
+    return not missing_columns, accessed_columns
 
-    # If we have column, try another validation to ensure safe execution pre deletion
+
+def _validate_filter_compiles(table: Table, tenant_filter: Callable[[Table], Any]) -> None:
+    """
+    Build the filter against the real table and compile it in a dummy query.
+
+    Raises:
+        ValueError: Filter has expression errors for this table
+    """
     try:
         filter_expression = tenant_filter(table)
         dummy_query = select(literal(1)).select_from(table).where(filter_expression)
-        logger.debug(f"[Tenant Wiper] [Filter] '{table.name}' compiled filter: {filter_expression} sql: {dummy_query}")
+        logger.debug(
+            "[Tenant Wiper] [Filter] '%s' compiled filter: %s sql: %s", table.name, filter_expression, dummy_query
+        )
         # We use a generic dialect for this.
         dummy_query.compile()
         # we validated what we could here, maybe add session execute() to ensure it works in context
-        return True, recorder.accessed_columns
     except Exception as e:
         try:
             # lambda/fn source code for better error reporting
@@ -290,27 +594,66 @@ def _can_apply_tenant_filter(table: Table, tenant_filter: Callable[[Table], Any]
         raise ValueError(f"Table '{table.name}': Error on applying tenant filter:\n{filter_source}. \nPlease check your tenant filter table compatibility or fix it: {e}")  # noqa
 
 
+def _can_apply_tenant_filter(table: Table, tenant_filter: Callable[[Table], Any],
+                             cache: Optional[Dict[Tuple[int, int], Tuple[bool, Set[str]]]] = None,
+                             compiled_pairs: Optional[Set[Tuple[int, int]]] = None
+                             ) -> Tuple[bool, Set[str]]:
+    """
+    Check if table can be filtered by the given tenant filter directly, validating it compiles.
+
+    Column checks are memoized in `cache`, and pairs already compiled are tracked in
+    `compiled_pairs`, so each (table, filter) pair is compiled at most once.
+
+    Returns:
+        bool, Set[str]: True if filter can be applied, and a set of accessed columns.
+
+    Raises:
+        ValueError: Filter has syntax/expression errors
+    """
+    can_apply, accessed_columns = _check_filter_applies(table, tenant_filter, cache)
+    if not can_apply:
+        return False, accessed_columns  # Table doesn't have required columns
+
+    # If we have column, try another validation to ensure safe execution pre deletion
+    pair_key = (id(table), id(tenant_filter))
+    if compiled_pairs is None or pair_key not in compiled_pairs:
+        _validate_filter_compiles(table, tenant_filter)
+        if compiled_pairs is not None:
+            compiled_pairs.add(pair_key)
+    return True, accessed_columns
+
+
 def _validate_relationship_path(relationship_path: str, metadata,
-                                tenant_filters: Optional[List[Callable[[Table], Any]]]=None) -> List[str]:
+                                tenant_filters: Optional[List[Callable[[Table], Any]]]=None,
+                                filter_cache: Optional[Dict[Tuple[int, int], Tuple[bool, Set[str]]]] = None,
+                                compiled_pairs: Optional[Set[Tuple[int, int]]] = None,
+                                all_columns: Optional[Dict[str, FrozenSet[str]]] = None,
+                                parsed_path: Optional[_ParsedJoinPath] = None
+                                ) -> List[str]:
     """
     Validate that all tables and columns referenced in a relationship path actually exist.
     Returns list of validation errors, empty list if valid.
+
+    `all_columns` maps table names to their column names; pass it when validating many
+    paths to avoid rebuilding column sets for every join step. `parsed_path` skips parsing
+    when the path was already parsed.
     """
     if not relationship_path:
         return ['Empty relationship path provided']
     validation_time_start = perf_counter()
     errors = []
     metadata_tables = metadata.tables
+    if all_columns is None:
+        all_columns = _build_columns_index(metadata)
     try:
-        parsed_path = _parse_join_path(relationship_path)
+        if parsed_path is None:
+            parsed_path = _parse_join_path(relationship_path)
     except ValueError as e:
         traceback.print_exc()
-        logger.error(f"Error parsing relationship path '{relationship_path}': {e}")
+        logger.error("Error parsing relationship path '%s': %s", relationship_path, e)
         return [str(e)]
 
-    for step in parsed_path['steps']:
-        from_table, from_key = step['from_table'], step['from_key']
-        to_table, to_key = step['to_table'], step['to_key']
+    for from_table, from_key, to_table, to_key in parsed_path.steps:
 
         # Check tables
         for table_name in [from_table, to_table]:
@@ -320,17 +663,15 @@ def _validate_relationship_path(relationship_path: str, metadata,
             continue
 
         # Check columns
-        from_cols = _get_all_columns_for_table(from_table, metadata, None)
-        if from_key not in from_cols:
+        if from_key not in all_columns[from_table]:
             errors.append(f"Column '{from_key}' does not exist in table '{from_table}'")
 
-        to_cols = _get_all_columns_for_table(to_table, metadata, None)
-        if to_key not in to_cols:
+        if to_key not in all_columns[to_table]:
             errors.append(f"Column '{to_key}' does not exist in table '{to_table}'")
 
     # Validate that the final table can be filtered by tenant filters
     if not errors and tenant_filters:
-        final_table_name = parsed_path['final_table']
+        final_table_name = parsed_path.final_table
         final_table = metadata_tables[final_table_name]
 
         # Check if any tenant filter can be applied to the final table
@@ -338,7 +679,9 @@ def _validate_relationship_path(relationship_path: str, metadata,
         can_filter_final_table = False
         for tenant_filter in tenant_filters:
             try:
-                can_apply, accessed_columns = _can_apply_tenant_filter(final_table, tenant_filter)
+                can_apply, accessed_columns = _can_apply_tenant_filter(
+                    final_table, tenant_filter, filter_cache, compiled_pairs
+                )
                 accessed_columns_pairs.append(list(accessed_columns))  # Use frozenset for immutability in set
                 if can_apply:
                     can_filter_final_table = True
@@ -356,7 +699,8 @@ def _validate_relationship_path(relationship_path: str, metadata,
             )
 
     end_time = perf_counter()
-    logger.debug(f'[Tenant Wiper] Validation time for {relationship_path} took {end_time - validation_time_start:.4f} seconds')  # noqa
+    logger.debug('[Tenant Wiper] Validation time for %s took %.4f seconds',
+                 relationship_path, end_time - validation_time_start)
     return errors
 
 
@@ -367,176 +711,513 @@ class TenantDeleter:
         """Initialize with a TenantWiperConfig."""
         self.config = config
         self.metadata = config.base.metadata
-        self.excluded_tables = set(config.excluded_tables)
-        self.pks_to_delete: Dict[str, Set[Any]] = defaultdict(set)
+        self.excluded_tables = config._excluded_tables_set
+        self.pks_to_delete: Dict[str, Sequence[Any]] = defaultdict(list)
+        # Tables whose PKs were collected in phase 1, only those with rows get a pks_to_delete entry
+        self._collected_tables: Set[str] = set()
+        # Rows that would be deleted per table, filled by a dry run
+        self.row_counts: Dict[str, int] = {}
+        # Temporary tables holding the PK snapshot of a table, when staging is enabled
+        self._staged_tables: Dict[str, Table] = {}
+        # PK collection queries by (table name, deduplicate), built once and reused by every delete() call
+        self._pk_query_cache: Dict[Tuple[str, bool], Optional[Tuple[Any, bool]]] = {}
+        # DELETE statement per table compiled to SQL, filled by a dry run in 'compile' mode
+        self.dry_run_statements: Dict[str, str] = {}
+
+        # Shared with every deleter of the same config, the topological sort runs once per config
+        self._deletion_order: Tuple[Table, ...] = config._deletion_order
+        self._pk_cols: Dict[str, List[Column]] = {
+            table.name: list(table.primary_key.columns)
+            for table in self._deletion_order if table.primary_key
+        }
+        # Plain dict of the metadata tables for join path step resolution
+        self._tables_by_name: Dict[str, Table] = dict(self.metadata.tables)
+        # Tables with a single integer PK column, their collected PKs are packed into 64-bit arrays
+        self._int_pk_tables: FrozenSet[str] = frozenset(
+            name for name, columns in self._pk_cols.items()
+            if len(columns) == 1 and isinstance(columns[0].type, Integer)
+        )
+        # Deletion order without explicitly excluded tables, so the phase loops don't re-check them
+        self._deletable_tables: Tuple[Table, ...] = config._deletable_tables
 
-    def _build_deletion_order(self) -> List[Table]:
+    def _build_deletion_order(self) -> Tuple[Table, ...]:
         """Returns tables sorted for safe deletion (dependencies first)."""
-        return list(reversed(self.metadata.sorted_tables))
+        return self._deletion_order
 
-    def _build_pk_collection_query(self, table: Table) -> Optional[Any]:
+    def _build_pk_collection_query(self, table: Table, deduplicate: bool = True) -> Optional[Tuple[Any, bool]]:
         """
         Builds a query to SELECT the primary keys of rows to be deleted for a given table.
         Treats direct tenant filters as zero-step paths, unifying all logic.
+        Returns the query and whether the primary key is composite, or None if nothing applies.
+
+        The query only depends on the config, so it is built once per table and reused. Its
+        filter values are bound parameters, so SQLAlchemy's compiled cache serves the SQL string.
+
+        Args:
+            table: Table to build the query for
+            deduplicate: Return every PK once, combining multiple paths with UNION instead of UNION ALL
+                and selecting DISTINCT on a single join path. Can be disabled when the query is
+                only used inside `IN (...)`, which tolerates duplicates.
         """
+        cache_key = (table.name, deduplicate)
+        if cache_key not in self._pk_query_cache:
+            self._pk_query_cache[cache_key] = self._compose_pk_collection_query(table, deduplicate)
+        return self._pk_query_cache[cache_key]
+
+    def _compose_pk_collection_query(self, table: Table, deduplicate: bool) -> Optional[Tuple[Any, bool]]:
+        """Builds the PK collection query of a table from its direct filters and relationship paths."""
         if not table.primary_key:
-            logger.warning(f"Table '{table.name}' has no primary key, cannot collect PKs.")
+            logger.warning("Table '%s' has no primary key, cannot collect PKs.", table.name)
             raise ValueError(f"Table '{table.name}' has no primary key, cannot collect PKs.")
 
-        primary_key_columns = list(table.primary_key.columns)
-        if len(primary_key_columns) == 1:
-            primary_selection = primary_key_columns[0]
-        else:
-            primary_selection = primary_key_columns
+        primary_key_columns = self._pk_cols[table.name]
+        is_composite = len(primary_key_columns) > 1
 
         all_queries = []
 
         # Add direct tenant filters as basic select query
-        for tenant_filter in self.config.tenant_filters:
-            try:
-                filter_expr = tenant_filter(table)
-                if isinstance(primary_selection, list):
-                    query = select(*primary_selection).where(filter_expr)
-                else:
-                    query = select(primary_selection).where(filter_expr)
-                all_queries.append(query)
-            except (AttributeError, KeyError):
-                continue
+        filter_expression = self.config._get_filter_expression(table)
+        if filter_expression is not None:
+            all_queries.append(select(*primary_key_columns).where(filter_expression))
 
         # Add relationship paths as join queries based on declared relationships config
         if table.name in self.config._relationship_dict:
             path_strings = self.config._relationship_dict[table.name]
-            logger.debug(f"[Tenant Deleter] [Collect] '{table.name}' using relationship paths: {path_strings}")
+            logger.debug("[Tenant Deleter] [Collect] '%s' using relationship paths: %s", table.name, path_strings)
 
+            direct_query_count = len(all_queries)
             for path_string in path_strings:
                 try:
-                    parsed_path = _parse_join_path(path_string)
+                    parsed_path = self.config._get_parsed_path(path_string)
                 except ValueError as e:
-                    logger.error(f"Could not parse relationship path for '{table.name}': {e}")
+                    logger.error("Could not parse relationship path for '%s': %s", table.name, e)
                     continue
 
-                if parsed_path['start_table'] != table.name:
-                    logger.error(f"Mismatched start table for {table.name} in path '{path_string}'")
+                if parsed_path.start_table != table.name:
+                    logger.error("Mismatched start table for %s in path '%s'", table.name, path_string)
                     continue
 
-                if isinstance(primary_selection, list):
-                    subquery = select(*primary_selection)
-                else:
-                    subquery = select(primary_selection)
-                join_string = ''
-                for i, step in enumerate(parsed_path['steps']):
-                    from_tbl = self.metadata.tables[step['from_table']]
-                    to_tbl = self.metadata.tables[step['to_table']]
-                    subquery = subquery.join(to_tbl, from_tbl.c[step['from_key']] == to_tbl.c[step['to_key']])
-                    join_string += f"{step['from_table']}.{step['from_key']}={step['to_table']}.{step['to_key']} "
-                    if i < len(parsed_path['steps']) - 1:
-                        join_string += '-> '
-                logger.info(f"[Tenant Deleter] [Collect] '{table.name}' path:  " + join_string)
+                subquery = select(*primary_key_columns)
+                for step in parsed_path.steps:
+                    from_tbl = self._tables_by_name[step.from_table]
+                    to_tbl = self._tables_by_name[step.to_table]
+                    subquery = subquery.join(to_tbl, from_tbl.c[step.from_key] == to_tbl.c[step.to_key])
+                if logger.isEnabledFor(logging.DEBUG):
+                    join_string = '-> '.join(
+                        f'{step.from_table}.{step.from_key}={step.to_table}.{step.to_key} '
+                        for step in parsed_path.steps
+                    )
+                    logger.debug("[Tenant Deleter] [Collect] '%s' path:  %s", table.name, join_string)
 
                 # Apply tenant filters to final table
-                final_table = self.metadata.tables[parsed_path['final_table']]
-                final_filters = []
-                for tenant_filter in self.config.tenant_filters:
-                    try:
-                        filter_expr = tenant_filter(final_table)
-                        final_filters.append(filter_expr)
-                    except (AttributeError, KeyError):
-                        continue
-
-                if final_filters:
-                    if len(final_filters) == 1:
-                        all_queries.append(subquery.where(final_filters[0]))
-                    else:
-                        all_queries.append(subquery.where(or_(*final_filters)))
+                final_table = self._tables_by_name[parsed_path.final_table]
+                final_filter = self.config._get_filter_expression(final_table)
+
+                if final_filter is not None:
+                    all_queries.append(subquery.where(final_filter))
                 else:
                     logger.error(
-                        f"Final table '{parsed_path['final_table']}' in path '{path_string}' "
-                        f"cannot be filtered by any tenant filters!"
+                        "Final table '%s' in path '%s' cannot be filtered by any tenant filters!",
+                        parsed_path.final_table, path_string
                     )
+            logger.debug(
+                "[Tenant Deleter] [Collect] '%s' found %d valid relationship paths",
+                table.name, len(all_queries) - direct_query_count
+            )
 
-        # Combine all queries with UNION
+        # Combine all queries with UNION, or UNION ALL to skip the dedup step
         if len(all_queries) == 1:
-            return all_queries[0]
+            single_query = all_queries[0]
+            # A join path repeats the PK once per matching row of the joined tables
+            if deduplicate and filter_expression is None:
+                single_query = single_query.distinct()
+            return single_query, is_composite
         elif len(all_queries) > 1:
-            return union(*all_queries)
+            return (union(*all_queries) if deduplicate else union_all(*all_queries)), is_composite
 
         return None
 
-    def _collect_pks_to_delete(self):
+    def _tables_requiring_pk_snapshot(self) -> Set[str]:
+        """
+        Find tables whose PK collection query joins through a table that is deleted before them.
+
+        Such tables cannot be deleted with a live subquery, because by the time their DELETE
+        runs the join path rows it depends on are already gone, so their PKs are collected
+        up front instead.
+        """
+        position = {table.name: i for i, table in enumerate(self._build_deletion_order())}
+        snapshot_tables = set()
+        for table_name, path_strings in self.config._relationship_dict.items():
+            if table_name not in position:
+                continue
+            for path_string in path_strings:
+                try:
+                    parsed_path = self.config._get_parsed_path(path_string)
+                except ValueError:
+                    continue
+                for step in parsed_path.steps:
+                    to_table = step.to_table
+                    if (to_table in position and to_table not in self.excluded_tables
+                            and position[to_table] < position[table_name]):
+                        snapshot_tables.add(table_name)
+        return snapshot_tables
+
+    def _collect_pks_to_delete(self, only_tables: Optional[Set[str]] = None):
         """
         PHASE 1: Iterate through all tables and collect the PKs of rows to be deleted.
         The order of table iteration does not matter here.
+
+        Args:
+            only_tables: If given, only collect PKs for these table names
         """
         logger.info('[Tenant Deleter] Phase 1: Collecting PKs to delete.')
-        all_tables = self._build_deletion_order()
-        for table in all_tables:
-            if table.name in self.excluded_tables:
-                logger.info(f"[Tenant Deleter] [Collect] '{table.name}' skipping explicitly excluded table")
-                continue
+        if self.excluded_tables:
+            logger.info(
+                '[Tenant Deleter] [Collect] skipping explicitly excluded tables: %s', sorted(self.excluded_tables)
+            )
+        if only_tables is None:
+            tables = self._deletable_tables
+        else:
+            tables = [table for table in self._deletable_tables if table.name in only_tables]
 
-            pk_query = self._build_pk_collection_query(table)
-            if pk_query is None:
-                raise ValueError(f'Table "{table.name}" found in metadata, but cannot find indirect relationship or applicable tenant filter')  # noqa
+        total_pks = 0
+        for table_name, pks in self._run_per_table(tables, self._collect_for_table):
+            self._collected_tables.add(table_name)
+            if pks:
+                self.pks_to_delete[table_name] = pks
+                total_pks += len(pks)
+        logger.info(
+            '[Tenant Deleter] [Collect] Found %d PKs to delete in %d of %d tables',
+            total_pks, len(self.pks_to_delete), len(tables)
+        )
+        logger.info('[Tenant Deleter] Finished Phase 1. PK collection complete.')
 
-            primary_key_columns = list(table.primary_key.columns)
-            if len(primary_key_columns) == 1:
-                primary_selection = primary_key_columns[0]
-            else:
-                # For composite keys, select all primary key columns as tuple
-                primary_selection = primary_key_columns
+    def _count_rows_to_delete(self):
+        """PHASE 1 of a dry run: count the rows to be deleted per table without fetching their PKs."""
+        logger.info('[Tenant Deleter] Phase 1: Counting rows to delete.')
+        if self.config.parallelism > 1:
+            results = self._run_per_table(self._deletable_tables, self._count_for_table)
+        else:
+            results = self._count_fused(self._deletable_tables)
+        for table_name, row_count in results:
+            self.row_counts[table_name] = row_count
+        logger.info(
+            '[Tenant Deleter] [Collect] Found %d rows to delete in %d of %d tables',
+            sum(self.row_counts.values()), sum(1 for count in self.row_counts.values() if count),
+            len(self.row_counts)
+        )
+        logger.info('[Tenant Deleter] Finished Phase 1. Row count complete.')
+
+    def _count_fused(self, tables: Sequence[Table]) -> List[Tuple[str, int]]:
+        """
+        Count the rows to delete of many tables per round-trip.
+
+        Each table's count becomes a scalar subquery column of one `SELECT`, so a schema is
+        counted in a few statements instead of one per table.
+        """
+        results = []
+        for chunk, count_queries in self._chunk_count_queries(tables):
+            fused_query = select(*[
+                count_query.scalar_subquery().label(f'count_{position}')
+                for position, count_query in enumerate(count_queries)
+            ])
             try:
-                # Handle composite primary keys in result processing
-                if isinstance(primary_selection, list):
-                    # For composite keys, we get tuples
-                    pks = [tuple(row) for row in self.session.execute(pk_query).all()]
-                else:
-                    # For single primary key, we get scalars
-                    pks = self.session.execute(pk_query).scalars().all()
+                row_counts = self.session.execute(fused_query).one()
             except Exception as e:
-                logger.error(f"[Tenant Deleter] [Collect] '{table.name}' SQL Execute error: {e}")
+                logger.error('[Tenant Deleter] [Collect] %s SQL Execute error: %s', [t.name for t in chunk], e)
                 raise
-            logger.debug(f"[Tenant Deleter] [Collect] '{table.name}' PK query: {pk_query}")
-            if pks:
-                logger.info(f"[Tenant Deleter] [Collect] '{table.name}' Found {len(pks)} PKs to delete ")
-                self.pks_to_delete[table.name].update(pks)
+            for table, row_count in zip(chunk, row_counts):
+                logger.debug("[Tenant Deleter] [Collect] '%s' Found %d rows to delete", table.name, row_count)
+                results.append((table.name, row_count))
+        return results
+
+    def _chunk_count_queries(self, tables: Sequence[Table]) -> Iterator[Tuple[List[Table], List[Any]]]:
+        """
+        Group tables and their count queries into chunks fused into one `SELECT` each.
+
+        A chunk holds at most _COUNT_TABLES_PER_QUERY tables and, on dialects with a bind parameter
+        limit, at most that many binds. A single table over the limit still gets a chunk of its own.
+        """
+        bind_limit = _MAX_BIND_PARAMS.get(self.session.get_bind().dialect.name)
+        chunk: List[Table] = []
+        count_queries: List[Any] = []
+        chunk_binds = 0
+        for table in tables:
+            count_query = self._build_count_query(table)
+            binds = _count_bind_params(count_query) if bind_limit else 0
+            if chunk and (len(chunk) == _COUNT_TABLES_PER_QUERY or (bind_limit and chunk_binds + binds > bind_limit)):
+                yield chunk, count_queries
+                chunk, count_queries, chunk_binds = [], [], 0
+            chunk.append(table)
+            count_queries.append(count_query)
+            chunk_binds += binds
+        if chunk:
+            yield chunk, count_queries
+
+    def _build_count_query(self, table: Table) -> Any:
+        """
+        Builds a `SELECT count(*)` over the distinct PKs matched by the PK collection query of a table.
+
+        Joins repeat a PK once per matching child row and paths may overlap, so the PKs are
+        deduplicated by the count query itself, over the paths combined with UNION ALL.
+        """
+        built_query = self._build_pk_collection_query(table, deduplicate=False)
+        if built_query is None:
+            raise ValueError(f'Table "{table.name}" found in metadata, but cannot find indirect relationship or applicable tenant filter')  # noqa
+
+        pk_query, _ = built_query
+        pk_rows = pk_query.subquery()
+        return select(func.count()).select_from(select(*pk_rows.c).distinct().subquery())
+
+    def _run_per_table(self, tables: Sequence[Table], run: Callable[[Table, Any], Tuple[str, Any]]
+                       ) -> List[Tuple[str, Any]]:
+        """
+        Run a read-only per-table query function for every table, in table order.
+
+        The queries are independent of each other, so with parallelism > 1 they run on separate
+        engine connections. Those only see committed data; a session bound to a Connection
+        instead of an Engine keeps running them serially on its own connection.
+        """
+        bind = self.session.get_bind()
+        if self.config.parallelism > 1 and len(tables) > 1 and isinstance(bind, Engine):
+            def run_on_engine(table: Table) -> Tuple[str, Any]:
+                with bind.connect() as connection:
+                    return run(table, connection)
+
+            with ThreadPoolExecutor(max_workers=self.config.parallelism) as executor:
+                return list(executor.map(run_on_engine, tables))
+        return [run(table, self.session) for table in tables]
+
+    def _count_for_table(self, table: Table, executor) -> Tuple[str, int]:
+        """
+        Count the rows of a single table matched by its PK collection query.
+
+        Args:
+            table: Table to count rows for
+            executor: Session or Connection used to execute the query
+        """
+        count_query = self._build_count_query(table)
+        try:
+            row_count = executor.execute(count_query).scalar()
+        except Exception as e:
+            logger.error("[Tenant Deleter] [Collect] '%s' SQL Execute error: %s", table.name, e)
+            raise
+        logger.debug("[Tenant Deleter] [Collect] '%s' Found %d rows to delete", table.name, row_count)
+        return table.name, row_count
+
+    def _collect_for_table(self, table: Table, executor) -> Tuple[str, Sequence[Any]]:
+        """
+        Run the PK collection query of a single table.
+
+        Args:
+            table: Table to collect PKs for
+            executor: Session or Connection used to execute the query
+        """
+        built_query = self._build_pk_collection_query(table)
+        if built_query is None:
+            raise ValueError(f'Table "{table.name}" found in metadata, but cannot find indirect relationship or applicable tenant filter')  # noqa
+
+        pk_query, is_composite = built_query
+        # Stream rows with a server-side cursor instead of materializing the full result list
+        streaming_query = pk_query.execution_options(stream_results=True)
+        try:
+            result = executor.execute(streaming_query).yield_per(self.config.batch_size or 500)
+            # The query is deduplicated server side, with UNION across paths or DISTINCT on a single
+            # join path, so a plain list is enough - no hashing into a set
+            if is_composite:
+                # For composite keys, we get tuples
+                pks = [tuple(row) for row in result]
+            elif table.name in self._int_pk_tables:
+                # Integer keys are packed into a 64-bit array, 8 bytes per PK instead of an int object
+                pks = self._pack_int_pks(result.scalars().partitions())
             else:
-                self.pks_to_delete[table.name] = set()
-                logger.info(f"[Tenant Deleter] [Collect] '{table.name}' Found 0 PKs to delete")
-        logger.info('[Tenant Deleter] Finished Phase 1. PK collection complete.')
+                # For single primary key, take the scalars without building Row objects
+                pks = result.scalars().all()
+        except Exception as e:
+            logger.error("[Tenant Deleter] [Collect] '%s' SQL Execute error: %s", table.name, e)
+            raise
+        # %-style so the query is only compiled to a string when debug logging is enabled
+        logger.debug("[Tenant Deleter] [Collect] '%s' PK query: %s", table.name, pk_query)
+        logger.debug("[Tenant Deleter] [Collect] '%s' Found %d PKs to delete", table.name, len(pks))
+        return table.name, pks
+
+    @staticmethod
+    def _pack_int_pks(partitions) -> Sequence[int]:
+        """Pack batches of integer PKs into an `array('q')`, falling back to a list for values beyond 64 bits."""
+        pks = array.array('q')
+        partitions = iter(partitions)
+        for partition in partitions:
+            packed_count = len(pks)
+            try:
+                pks.extend(partition)
+            except OverflowError:
+                # e.g. unsigned BIGINT, keep the values as Python ints
+                del pks[packed_count:]
+                return [*pks, *partition, *(pk for rest in partitions for pk in rest)]
+        return pks
 
     def _execute_deletions(self):
         """
-        PHASE 2: Delete the collected PKs in the correct, FK-safe order without orphan issue
+        PHASE 2: Delete the collected PKs in the correct, FK-safe order without orphan issue.
+
+        Tables with collected PKs are deleted by PK batches, all others are deleted server side
+        with the PK collection query as subquery, so their PKs never leave the database.
         """
         logger.info('[Tenant Deleter] Phase 2: Executing deletions.')
-        deletion_order = self._build_deletion_order()
-
-        for table in deletion_order:
-            if table.name in self.pks_to_delete:
-                pks = list(self.pks_to_delete[table.name])
-                if not pks or len(pks) == 0:
-                    logger.info(f"[Tenant Deleter] [Execute] Deleting 0 rows from '{table.name}'")
-                    continue
+        bind_limit = _MAX_BIND_PARAMS.get(self.session.get_bind().dialect.name)
+        for table in self._deletable_tables:
+            if table.name in self._staged_tables:
+                self._delete_staged(table)
+                continue
+            if table.name not in self.pks_to_delete:
+                if table.name not in self._collected_tables:
+                    self._delete_by_subquery(table)
+                # Collected tables without an entry have no rows to delete
+                continue
 
-                logger.info(f"[Tenant Deleter] [Execute] Deleting {len(pks)} rows from '{table.name}'")
-                primary_key_columns = list(table.primary_key.columns)
+            pks = self.pks_to_delete[table.name]
+            logger.info("[Tenant Deleter] [Execute] Deleting %d rows from '%s'", len(pks), table.name)
+            primary_key_columns = self._pk_cols[table.name]
 
+            # One statement per table with an expanding IN parameter, so it is compiled once and
+            # reused from the statement cache for every batch
+            if len(primary_key_columns) == 1:
+                pk_expression = primary_key_columns[0]
+            else:
+                pk_expression = tuple_(*primary_key_columns)
+            delete_query = table.delete().where(pk_expression.in_(bindparam('pks', expanding=True)))
 
-                # avoid sending a massive IN clause to the DB
-                batch_size = self.config.batch_size or 500
-                for i in range(0, len(pks), batch_size):
-                    batch = pks[i:i + batch_size]
-                    # Recreate condition for each batch
-                    if len(primary_key_columns) == 1:
-                        batch_condition = primary_key_columns[0].in_(batch)
-                    else:
-                        batch_condition = tuple_(*primary_key_columns).in_(batch)
-                    delete_query = table.delete().where(batch_condition)
-                    self.session.execute(delete_query)
+            # Every key column takes one bind per row, keep batches under the dialect's bind limit
+            batch_size = self.config.batch_size or 500
+            if bind_limit is not None:
+                batch_size = max(1, min(batch_size, bind_limit // len(primary_key_columns)))
+            for i in range(0, len(pks), batch_size):
+                self.session.execute(delete_query, {'pks': list(pks[i:i + batch_size])})
 
         logger.info('[Tenant Deleter] Finished Phase 2. Deletions complete.')
 
-    def delete(self, session: Session, dry_run: bool = False, commit: bool = False):
+    def _stage_pks_in_temp_tables(self, only_tables: Set[str]):
+        """
+        PHASE 1 with staging: copy the PKs of the given tables into temporary tables server side.
+
+        Python only keeps the temporary table, so snapshots of any size never leave the database.
+        """
+        logger.info('[Tenant Deleter] Phase 1: Staging PKs to delete in temporary tables.')
+        connection = self.session.connection()
+        for table in self._deletable_tables:
+            if table.name not in only_tables:
+                continue
+            built_query = self._build_pk_collection_query(table)
+            if built_query is None:
+                raise ValueError(f'Table "{table.name}" found in metadata, but cannot find indirect relationship or applicable tenant filter')  # noqa
+
+            pk_query, _ = built_query
+            primary_key_columns = self._pk_cols[table.name]
+            temp_table = Table(
+                f'_wipe_{table.name}'[:63], MetaData(),
+                *[Column(column.name, column.type) for column in primary_key_columns],
+                prefixes=['TEMPORARY']
+            )
+            temp_table.create(connection)
+            self._staged_tables[table.name] = temp_table
+            result = self.session.execute(
+                temp_table.insert().from_select([column.name for column in primary_key_columns], pk_query)
+            )
+            logger.debug("[Tenant Deleter] [Collect] '%s' Staged %d PKs to delete", table.name, result.rowcount)
+        logger.info('[Tenant Deleter] [Collect] Staged PKs of %d tables', len(self._staged_tables))
+        logger.info('[Tenant Deleter] Finished Phase 1. PK staging complete.')
+
+    def _delete_staged(self, table: Table):
+        """Delete the rows of a table whose PKs were staged in its temporary table."""
+        temp_table = self._staged_tables[table.name]
+        primary_key_columns = self._pk_cols[table.name]
+        if len(primary_key_columns) == 1:
+            condition = primary_key_columns[0].in_(select(*temp_table.columns))
+        else:
+            condition = tuple_(*primary_key_columns).in_(select(*temp_table.columns))
+        result = self.session.execute(table.delete().where(condition))
+        logger.info("[Tenant Deleter] [Execute] Deleted %d rows from '%s'", result.rowcount, table.name)
+
+    def _drop_staged_tables(self):
+        """Drop the temporary tables created for staged PKs."""
+        connection = self.session.connection()
+        for temp_table in self._staged_tables.values():
+            temp_table.drop(connection, checkfirst=True)
+        self._staged_tables = {}
+
+    def _build_cascade_delete_stmt(self, table: Table) -> Any:
+        """
+        Builds a single `DELETE` statement removing the tenant rows of a table.
+
+        Direct filters go into the `WHERE` clause as is, each join path becomes a
+        `first_key IN (SELECT ...)` condition whose subquery starts at the path's second table.
+        The deleted table itself is never selected from, which MySQL rejects (error 1093).
+        """
+        conditions = []
+        filter_expression = self.config._get_filter_expression(table)
+        if filter_expression is not None:
+            conditions.append(filter_expression)
+        for path_string in self.config._relationship_dict.get(table.name, ()):
+            condition = self._build_path_condition(table, path_string)
+            if condition is not None:
+                conditions.append(condition)
+
+        if not conditions:
+            raise ValueError(f'Table "{table.name}" found in metadata, but cannot find indirect relationship or applicable tenant filter')  # noqa
+        return table.delete().where(or_(*conditions))
+
+    def _build_path_condition(self, table: Table, path_string: str) -> Optional[Any]:
+        """Builds the `IN (SELECT ...)` condition matching the rows of a table reachable through a join path."""
+        try:
+            parsed_path = self.config._get_parsed_path(path_string)
+        except ValueError as e:
+            logger.error("Could not parse relationship path for '%s': %s", table.name, e)
+            return None
+        final_filter = self.config._get_filter_expression(self._tables_by_name[parsed_path.final_table])
+        if parsed_path.start_table != table.name or final_filter is None:
+            logger.error("Relationship path '%s' cannot select rows of '%s'", path_string, table.name)
+            return None
+
+        if not parsed_path.steps:
+            # Path naming the table alone, filtered directly
+            return final_filter
+        first_step, *other_steps = parsed_path.steps
+        subquery = select(self._tables_by_name[first_step.to_table].c[first_step.to_key])
+        for step in other_steps:
+            from_tbl = self._tables_by_name[step.from_table]
+            to_tbl = self._tables_by_name[step.to_table]
+            subquery = subquery.join(to_tbl, from_tbl.c[step.from_key] == to_tbl.c[step.to_key])
+        subquery = subquery.where(final_filter)
+        if any(step.to_table == table.name for step in parsed_path.steps):
+            # Self-referencing path, MySQL only reads the deleted table through a derived table
+            derived = subquery.subquery()
+            subquery = select(*derived.c)
+        return table.c[first_step.from_key].in_(subquery)
+
+    def _delete_by_subquery(self, table: Table):
+        """Delete tenant rows of a table server side, without fetching their PKs."""
+        result = self.session.execute(self._build_cascade_delete_stmt(table))
+        logger.info("[Tenant Deleter] [Execute] Deleted %d rows from '%s'", result.rowcount, table.name)
+
+    def _compile_deletions(self):
+        """
+        Dry run without round-trips: compile the DELETE statement of every table and log its SQL.
+
+        Tables that are deleted by PK snapshot in a real run are shown with their join paths
+        as subqueries, which select the same rows.
+        """
+        dialect = self.session.get_bind().dialect
+        for table in self._deletable_tables:
+            statement = self._build_cascade_delete_stmt(table)
+            try:
+                compiled = statement.compile(dialect=dialect, compile_kwargs={'literal_binds': True})
+            except Exception:
+                # Values without a literal rendering are shown as bind parameters
+                compiled = statement.compile(dialect=dialect)
+            self.dry_run_statements[table.name] = str(compiled)
+            logger.info("[Tenant Deleter] [Dry Run] '%s' SQL: %s", table.name, compiled)
+
+    def delete(self, session: Session, dry_run: bool = False, commit: bool = False, dry_run_mode: str = 'count'):
         """
         Delete tenant data using the configured settings.
 
@@ -544,35 +1225,46 @@ class TenantDeleter:
             session: SQLAlchemy session
             dry_run: If True, only report what would be deleted
             commit: If True, commit the transaction
+            dry_run_mode: 'count' counts the rows to delete per table server side, 'compile' only
+                compiles and logs the DELETE statements without touching the database
         """
+        if dry_run_mode not in _DRY_RUN_MODES:
+            raise ValueError(f"dry_run_mode must be one of {_DRY_RUN_MODES}, got '{dry_run_mode}'")
         self.session = session
+        # Start from a clean slate so PKs collected by an earlier call are not deleted twice
+        self.pks_to_delete = defaultdict(list)
+        self._collected_tables = set()
+        self.row_counts = {}
+        self._staged_tables = {}
+        self.dry_run_statements = {}
         start_ms = perf_counter()
-        logger.info(
-            f'[Tenant Deleter] Starting tenant deletion. '
-            f'Dry Run: {dry_run}'
-        )
+        logger.info('[Tenant Deleter] Starting tenant deletion. Dry Run: %s', dry_run)
 
         try:
-            # Phase 1: collect the PKs to delete
-            self._collect_pks_to_delete()
-
-            # If it's a dry run, report and exit before modifying the DB
+            # If it's a dry run, count server side, report and exit before modifying the DB
+            if dry_run and dry_run_mode == 'compile':
+                self._compile_deletions()
+                return
             if dry_run:
+                self._count_rows_to_delete()
                 logger.info('--- DRY RUN REPORT ---')
-                if not self.pks_to_delete:
+                report = {table: f'{count} rows' for table, count in self.row_counts.items() if count}
+                if not report:
                     logger.info('No data found for deletion.')
                 else:
-                    report = {
-                        table: f'{len(pks)} rows'
-                        for table, pks in self.pks_to_delete.items()
-                    }
-                    logger.info('The following rows WOULD be deleted:')
-                    pprint.pprint(report)
+                    logger.info('The following rows WOULD be deleted:\n%s', pprint.pformat(report))
                 logger.info('--- END DRY RUN REPORT ---')
                 return
 
+            # Phase 1: snapshot the PKs of tables whose join paths would be broken by earlier deletions
+            if self.config.stage_pks_in_temp_tables:
+                self._stage_pks_in_temp_tables(self._tables_requiring_pk_snapshot())
+            else:
+                self._collect_pks_to_delete(only_tables=self._tables_requiring_pk_snapshot())
+
             # Phase 2: execute the deletions
             self._execute_deletions()
+            self._drop_staged_tables()
 
             if commit:
                 logger.info('[Tenant Deleter] Committing transaction.')
@@ -581,10 +1273,16 @@ class TenantDeleter:
                 session.flush()
 
             end_ms = perf_counter()
-            logger.info(f'[Tenant Deleter] Completed successfully in {end_ms - start_ms:.2f} seconds')
+            logger.info('[Tenant Deleter] Completed successfully in %.2f seconds', end_ms - start_ms)
 
         except Exception as e:
             session.rollback()
-            logger.error(f'Error during tenant data deletion: {str(e)}')
+            if self._staged_tables:
+                # Databases without transactional DDL keep temporary tables past the rollback
+                try:
+                    self._drop_staged_tables()
+                except Exception:
+                    logger.warning('[Tenant Deleter] Could not drop temporary PK tables', exc_info=True)
+            logger.error('Error during tenant data deletion: %s', e)
             traceback.print_exc()
             raise
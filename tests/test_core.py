@@ -1,173 +1,381 @@
+import array
 import logging
+import warnings
+from typing import NamedTuple
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import Column, ForeignKey, Integer, String, create_engine
-from sqlalchemy.orm import Session, declarative_base, relationship
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    Integer,
+    String,
+    Table,
+    and_,
+    create_engine,
+    event,
+    func,
+    insert,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import Session, backref, configure_mappers, declarative_base, relationship
+from sqlalchemy.pool import StaticPool
+
+from sqlalchemy_tenant_wiper import core
+from sqlalchemy_tenant_wiper.core import (
+    TenantColumnFilter,
+    TenantDeleter,
+    TenantWiperConfig,
+    _can_apply_tenant_filter,
+    _get_model_class_for_table,
+    _parse_join_path,
+)
+
+# Test models, declared once for the whole module
+_Base = declarative_base()
+
+
+class User(_Base):
+    __tablename__ = 'users'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+    tenant_id = Column(String(36))  # UUID as string
+    org_id = Column(String(36))
+
+
+class Order(_Base):
+    __tablename__ = 'orders'
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'))
+    tenant_id = Column(String(36))
+    amount = Column(Integer)
+    # Rows are removed by the database cascade, not loaded and deleted by the ORM
+    user = relationship('User', backref=backref('orders', passive_deletes=True))
+
+
+class Product(_Base):
+    __tablename__ = 'products'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100))
+    # No tenant columns - needs relationship
+
+
+class ProductOrder(_Base):
+    __tablename__ = 'product_orders'
+    product_id = Column(Integer, ForeignKey('products.id', ondelete='CASCADE'), primary_key=True)
+    order_id = Column(Integer, ForeignKey('orders.id', ondelete='CASCADE'), primary_key=True)
+    quantity = Column(Integer)
+    product = relationship('Product', backref=backref('product_orders', passive_deletes=True))
+    order = relationship('Order', backref=backref('product_orders', passive_deletes=True))
+    # Composite primary key example
+
+
+class AuditLog(_Base):
+    __tablename__ = 'audit_logs'
+    id = Column(Integer, primary_key=True)
+    action = Column(String(50))
+    # No tenant columns - excluded table
+
+
+# New models for testing multiple relationship paths
+class Company(_Base):
+    __tablename__ = 'companies'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100))
+    tenant_id = Column(String(36))
+
+
+class Department(_Base):
+    __tablename__ = 'departments'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100))
+    tenant_id = Column(String(36))
+
+
+class Employee(_Base):
+    __tablename__ = 'employees'
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100))
+    company_id = Column(Integer, ForeignKey('companies.id'))
+    department_id = Column(Integer, ForeignKey('departments.id'))
+    # No tenant columns - has two paths to tenant data
+
+
+_MODELS = {
+    'User': User,
+    'Order': Order,
+    'Product': Product,
+    'ProductOrder': ProductOrder,
+    'AuditLog': AuditLog,
+    'Company': Company,
+    'Department': Department,
+    'Employee': Employee
+}
+# Resolve the relationships now instead of on the first query of a test
+configure_mappers()
+# Expected deletion order of the test schema, dependencies first
+SORTED_TABLES_REV = tuple(reversed(_Base.metadata.sorted_tables))
+# Fixture INSERT statements, built once so every test reuses them from the compiled cache
+_INSERTS = {name: insert(model.__table__) for name, model in _MODELS.items()}
+
+
+# Test fixtures
+@pytest.fixture(scope='session')
+def mock_engine():
+    """
+    Create an in-memory SQLite database shared by all tests, with foreign keys enforced.
 
-from sqlalchemy_tenant_wiper.core import TenantDeleter, TenantWiperConfig, _parse_join_path
+    A single connection backs the database, every test runs in a transaction that is rolled back.
+    """
+    engine = create_engine(
+        'sqlite:///:memory:', poolclass=StaticPool, connect_args={'check_same_thread': False}
+    )
 
-logging.getLogger().setLevel(logging.DEBUG)
+    @event.listens_for(engine, 'connect')
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute('PRAGMA foreign_keys=ON')
+        # Temporary PK staging tables stay in memory as well, durability is irrelevant for tests
+        dbapi_connection.execute('PRAGMA temp_store=MEMORY')
+        dbapi_connection.execute('PRAGMA synchronous=OFF')
+        # Let SQLAlchemy emit BEGIN itself, pysqlite's implicit transactions break SAVEPOINTs
+        dbapi_connection.isolation_level = None
 
-# Test fixtures and models
-@pytest.fixture
-def mock_engine():
-    """Create an in-memory SQLite database for testing."""
-    return create_engine('sqlite:///:memory:')
+    @event.listens_for(engine, 'begin')
+    def begin_transaction(connection):
+        connection.exec_driver_sql('BEGIN')
 
+    yield engine
+    engine.dispose()
 
-@pytest.fixture
+
+@pytest.fixture(scope='session')
 def test_base():
-    """Create a test SQLAlchemy Base."""
-    return declarative_base()
+    """The test SQLAlchemy Base."""
+    return _Base
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def test_models(test_base):
-    """Create test models for various scenarios."""
-
-    class User(test_base):
-        __tablename__ = 'users'
-        id = Column(Integer, primary_key=True)
-        name = Column(String(50))
-        tenant_id = Column(String(36))  # UUID as string
-        org_id = Column(String(36))
-
-    class Order(test_base):
-        __tablename__ = 'orders'
-        id = Column(Integer, primary_key=True)
-        user_id = Column(Integer, ForeignKey('users.id'))
-        tenant_id = Column(String(36))
-        amount = Column(Integer)
-        user = relationship('User')
-
-    class Product(test_base):
-        __tablename__ = 'products'
-        id = Column(Integer, primary_key=True)
-        name = Column(String(100))
-        # No tenant columns - needs relationship
-
-    class ProductOrder(test_base):
-        __tablename__ = 'product_orders'
-        product_id = Column(Integer, ForeignKey('products.id'), primary_key=True)
-        order_id = Column(Integer, ForeignKey('orders.id'), primary_key=True)
-        quantity = Column(Integer)
-        # Composite primary key example
-
-    class AuditLog(test_base):
-        __tablename__ = 'audit_logs'
-        id = Column(Integer, primary_key=True)
-        action = Column(String(50))
-        # No tenant columns - excluded table
-
-    # New models for testing multiple relationship paths
-    class Company(test_base):
-        __tablename__ = 'companies'
-        id = Column(Integer, primary_key=True)
-        name = Column(String(100))
-        tenant_id = Column(String(36))
-
-    class Department(test_base):
-        __tablename__ = 'departments'
-        id = Column(Integer, primary_key=True)
-        name = Column(String(100))
-        tenant_id = Column(String(36))
-
-    class Employee(test_base):
-        __tablename__ = 'employees'
-        id = Column(Integer, primary_key=True)
-        name = Column(String(100))
-        company_id = Column(Integer, ForeignKey('companies.id'))
-        department_id = Column(Integer, ForeignKey('departments.id'))
-        # No tenant columns - has two paths to tenant data
-
-    return {
-        'User': User,
-        'Order': Order,
-        'Product': Product,
-        'ProductOrder': ProductOrder,
-        'AuditLog': AuditLog,
-        'Company': Company,
-        'Department': Department,
-        'Employee': Employee
-    }
+    """Test models for various scenarios."""
+    return _MODELS
+
+
+def _count_rows(session, model, *criteria):
+    """Count the rows of a model's table matching criteria with a Core `SELECT count(*)`, without loading entities."""
+    return session.execute(select(func.count()).select_from(model.__table__).where(*criteria)).scalar_one()
+
+
+def _ids(session, model):
+    """Set of the `id` values in a model's table."""
+    return set(session.execute(select(model.__table__.c.id)).scalars())
+
+
+# Defaults shared by the configuration tests
+DEFAULT_EXCLUDED_TABLES = ['audit_logs', 'employees', 'departments', 'companies']
+_SHARED_TENANT_ID = str(uuid4())
+# The two join paths reaching the tenant of an employee, through its company or its department
+EMPLOYEE_JOIN_PATHS = ('employees__company_id=id__companies', 'employees__department_id=id__departments')
+
+
+def _default_tenant_filter(table):
+    return table.c.tenant_id == _SHARED_TENANT_ID
+
 
+def _raise_database_error(*args, **kwargs):
+    raise Exception('Database error')
 
 @pytest.fixture
+def config_factory(test_base, test_models):
+    """Build configs over the test models, only the parts a test cares about need to be passed."""
+    def make(tenant_join_paths, excluded_tables=None, tenant_filters=None, validate_on_init=False):
+        return TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[_default_tenant_filter] if tenant_filters is None else tenant_filters,
+            tenant_join_paths=tenant_join_paths,
+            excluded_tables=list(DEFAULT_EXCLUDED_TABLES) if excluded_tables is None else excluded_tables,
+            validate_on_init=validate_on_init
+        )
+    return make
+
+
+class _TenantData(NamedTuple):
+    """Tenant and org IDs of the seeded rows, the target ones are deleted by the tests."""
+    target_tenant_id: str
+    target_org_id: str
+    other_tenant_id: str
+    other_org_id: str
+
+
+@pytest.fixture(scope='session')
 def tenant_data():
-    """Create tenant IDs for testing."""
-    return {
-        'target_tenant_id': str(uuid4()),
-        'target_org_id': str(uuid4()),
-        'other_tenant_id': str(uuid4()),
-        'other_org_id': str(uuid4())
-    }
+    """
+    Create tenant IDs for testing.
+
+    The IDs are the same for every test of a session, each test's rows are rolled back anyway.
+    """
+    return _TenantData(
+        target_tenant_id=str(uuid4()),
+        target_org_id=str(uuid4()),
+        other_tenant_id=str(uuid4()),
+        other_org_id=str(uuid4())
+    )
+
+
+@pytest.fixture(scope='session')
+def default_config(test_base, tenant_data):
+    """
+    Config used by most data tests, deleting the target tenant with the default join paths and exclusions.
+
+    Built once per session, deletions never mutate the config so it is safe to share.
+    """
+    target_tenant_id = tenant_data.target_tenant_id
+    return TenantWiperConfig(
+        base=test_base,
+        tenant_filters=[lambda table: table.c.tenant_id == target_tenant_id],
+        tenant_join_paths=[
+            'product_orders__order_id=id__orders',
+            'products__id=product_id__product_orders__order_id=id__orders'
+        ],
+        excluded_tables=list(DEFAULT_EXCLUDED_TABLES),
+        validate_on_init=False
+    )
+
+
+@pytest.fixture(scope='session')
+def multi_path_config(test_base, tenant_data):
+    """Config reaching the employees table of the target tenant through both its company and department."""
+    target_tenant_id = tenant_data.target_tenant_id
+    return TenantWiperConfig(
+        base=test_base,
+        tenant_filters=[lambda table: table.c.tenant_id == target_tenant_id],
+        tenant_join_paths=list(EMPLOYEE_JOIN_PATHS),
+        excluded_tables=['audit_logs', 'users', 'orders', 'products', 'product_orders'],
+        validate_on_init=False
+    )
+
+
+@pytest.fixture(scope='session')
+def seeded_connection(mock_engine, test_base, test_models, tenant_data):
+    """
+    Connection to the shared database with the schema and test rows in place.
+
+    The rows are inserted once, in an outer transaction that stays open for the whole session and is
+    rolled back at the end, every test only rolls back to its own SAVEPOINT.
+    """
+    connection = mock_engine.connect()
+    with connection.begin():
+        test_base.metadata.create_all(connection)
+    transaction = connection.begin()
+
+    target_tenant_id = tenant_data.target_tenant_id
+    target_org_id = tenant_data.target_org_id
+    other_tenant_id = tenant_data.other_tenant_id
+    other_org_id = tenant_data.other_org_id
+
+    # Rows are inserted with one Core executemany per table, parents first
+    rows_by_model = [
+        # Users - mix of target tenant and other tenant
+        ('User', [
+            {'id': 1, 'name': 'John', 'tenant_id': target_tenant_id, 'org_id': target_org_id},
+            {'id': 2, 'name': 'Jane', 'tenant_id': target_tenant_id, 'org_id': target_org_id},
+            {'id': 3, 'name': 'Bob', 'tenant_id': other_tenant_id, 'org_id': other_org_id},
+        ]),
+        # Orders - some for target tenant, some for other
+        ('Order', [
+            {'id': 1, 'user_id': 1, 'tenant_id': target_tenant_id, 'amount': 100},
+            {'id': 2, 'user_id': 2, 'tenant_id': target_tenant_id, 'amount': 200},
+            {'id': 3, 'user_id': 3, 'tenant_id': other_tenant_id, 'amount': 300},
+        ]),
+        # Products (no tenant info - will be filtered via relationships)
+        ('Product', [
+            {'id': 1, 'name': 'Widget'},
+            {'id': 2, 'name': 'Gadget'},
+            {'id': 3, 'name': 'Tool'},
+        ]),
+        # Product Orders (composite PK) - mix of tenant and non-tenant
+        ('ProductOrder', [
+            {'product_id': 1, 'order_id': 1, 'quantity': 5},  # target tenant
+            {'product_id': 2, 'order_id': 2, 'quantity': 3},  # target tenant
+            {'product_id': 1, 'order_id': 2, 'quantity': 1},  # target tenant, second order of the same product
+            {'product_id': 3, 'order_id': 3, 'quantity': 7},  # other tenant
+        ]),
+        # Audit Logs (excluded from deletion)
+        ('AuditLog', [
+            {'id': 1, 'action': 'login'},
+            {'id': 2, 'action': 'logout'},
+        ]),
+        # Test data for multiple relationship paths
+        ('Company', [
+            {'id': 1, 'name': 'Target Corp', 'tenant_id': target_tenant_id},
+            {'id': 2, 'name': 'Other Corp', 'tenant_id': other_tenant_id},
+        ]),
+        ('Department', [
+            {'id': 1, 'name': 'Target Engineering', 'tenant_id': target_tenant_id},
+            {'id': 2, 'name': 'Other Engineering', 'tenant_id': other_tenant_id},
+        ]),
+        # Employees with different relationship paths to tenant
+        ('Employee', [
+            # Both paths point to target tenant
+            {'id': 1, 'name': 'Alice', 'company_id': 1, 'department_id': 1},
+            # Both paths point to other tenant
+            {'id': 2, 'name': 'Bob', 'company_id': 2, 'department_id': 2},
+            # Mixed paths: target company, other department
+            {'id': 3, 'name': 'Charlie', 'company_id': 1, 'department_id': 2},
+        ]),
+    ]
+    for model_name, rows in rows_by_model:
+        connection.execute(_INSERTS[model_name], rows)
+
+    yield connection
+
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
-def test_session(mock_engine, test_base, test_models, tenant_data):
-    """Create a test session with populated data."""
-    test_base.metadata.create_all(mock_engine)
-    session = Session(mock_engine)
-
-    target_tenant_id = tenant_data['target_tenant_id']
-    target_org_id = tenant_data['target_org_id']
-    other_tenant_id = tenant_data['other_tenant_id']
-    other_org_id = tenant_data['other_org_id']
-
-    # Users - mix of target tenant and other tenant
-    user1 = test_models['User'](id=1, name='John', tenant_id=target_tenant_id, org_id=target_org_id)
-    user2 = test_models['User'](id=2, name='Jane', tenant_id=target_tenant_id, org_id=target_org_id)
-    user3 = test_models['User'](id=3, name='Bob', tenant_id=other_tenant_id, org_id=other_org_id)
-
-    # Orders - some for target tenant, some for other
-    order1 = test_models['Order'](id=1, user_id=1, tenant_id=target_tenant_id, amount=100)
-    order2 = test_models['Order'](id=2, user_id=2, tenant_id=target_tenant_id, amount=200)
-    order3 = test_models['Order'](id=3, user_id=3, tenant_id=other_tenant_id, amount=300)
-
-    # Products (no tenant info - will be filtered via relationships)
-    product1 = test_models['Product'](id=1, name='Widget')
-    product2 = test_models['Product'](id=2, name='Gadget')
-    product3 = test_models['Product'](id=3, name='Tool')
-
-    # Product Orders (composite PK) - mix of tenant and non-tenant
-    po1 = test_models['ProductOrder'](product_id=1, order_id=1, quantity=5)  # target tenant
-    po2 = test_models['ProductOrder'](product_id=2, order_id=2, quantity=3)  # target tenant
-    po3 = test_models['ProductOrder'](product_id=3, order_id=3, quantity=7)  # other tenant
-
-    # Audit Logs (excluded from deletion)
-    audit1 = test_models['AuditLog'](id=1, action='login')
-    audit2 = test_models['AuditLog'](id=2, action='logout')
-
-    # Test data for multiple relationship paths
-    company1 = test_models['Company'](id=1, name='Target Corp', tenant_id=target_tenant_id)
-    company2 = test_models['Company'](id=2, name='Other Corp', tenant_id=other_tenant_id)
-
-    dept1 = test_models['Department'](id=1, name='Target Engineering', tenant_id=target_tenant_id)
-    dept2 = test_models['Department'](id=2, name='Other Engineering', tenant_id=other_tenant_id)
-
-    # Employees with different relationship paths to tenant
-    # Both paths point to target tenant
-    emp1 = test_models['Employee'](id=1, name='Alice', company_id=1, department_id=1)
-    # Both paths point to other tenant
-    emp2 = test_models['Employee'](id=2, name='Bob', company_id=2, department_id=2)
-    # Mixed paths: target company, other department
-    emp3 = test_models['Employee'](id=3, name='Charlie', company_id=1, department_id=2)
-
-    session.add_all([
-        user1, user2, user3,
-        order1, order2, order3,
-        product1, product2, product3,
-        po1, po2, po3,
-        audit1, audit2,
-        company1, company2,
-        dept1, dept2,
-        emp1, emp2, emp3
-    ])
-    session.commit()
+def test_session(seeded_connection, tenant_data):
+    """
+    Create a test session with populated data.
+
+    Everything a test does runs inside a SAVEPOINT that is rolled back on teardown, commits and
+    rollbacks of the session only end an inner SAVEPOINT which is restarted right away.
+    """
+    connection = seeded_connection
+    test_savepoint = connection.begin_nested()
+    # Objects loaded by tests are not expired and refreshed on every access after a commit
+    session = Session(bind=connection, expire_on_commit=False)
+    nested = connection.begin_nested()
+
+    @event.listens_for(session, 'after_transaction_end')
+    def restart_savepoint(session, ended_transaction):
+        nonlocal nested
+        if not nested.is_active:
+            nested = connection.begin_nested()
+
+    yield session, tenant_data
+
+    event.remove(session, 'after_transaction_end', restart_savepoint)
+    session.close()
+    if nested.is_active:
+        nested.rollback()
+    test_savepoint.rollback()
 
-    return session, tenant_data
+
+@pytest.fixture
+def recorded_statements(seeded_connection):
+    """Record every SQL statement sent to the shared connection while the test runs."""
+    statements = []
+
+    def record_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(seeded_connection, 'before_cursor_execute', record_statement)
+    yield statements
+    event.remove(seeded_connection, 'before_cursor_execute', record_statement)
 
 
 class TestTenantWiperConfig:
@@ -183,16 +391,26 @@ class TestTenantWiperConfig:
         assert config.base == test_base
         assert config.tenant_filters == []
         assert config.relationships == []
-        assert config.excluded_tables == []
+        assert config.excluded_tables == ()
         assert config.validate_on_init is False
         assert config._relationship_dict == {}
 
+    def test_excluded_tables_cannot_be_mutated_after_init(self, test_base):
+        """Excluded tables are read-only, so cached exclusions cannot go stale."""
+        excluded = ['audit_logs']
+        config = TenantWiperConfig(base=test_base, excluded_tables=excluded, validate_on_init=False)
+        excluded.append('companies')
+
+        assert config.excluded_tables == ('audit_logs',)
+        with pytest.raises(AttributeError):
+            config.excluded_tables.append('companies')
+        assert 'companies' in {table.name for table in TenantDeleter(config)._deletable_tables}
+
     def test_init_with_tenant_filters(self, test_base):
         """Test config initialization with tenant filters."""
-        test_uuid = uuid4()
         tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-            lambda table: table.c.org_id.in_([str(test_uuid)])
+            lambda table: table.c.tenant_id == _SHARED_TENANT_ID,
+            lambda table: table.c.org_id.in_([_SHARED_TENANT_ID])
         ]
 
         config = TenantWiperConfig(
@@ -204,282 +422,164 @@ class TestTenantWiperConfig:
         assert len(config.tenant_filters) == 2
         assert config.tenant_filters == tenant_filters
 
-    def test_validate_success(self, test_base, test_models):
+    def test_validate_success(self, config_factory):
         """Test successful configuration validation."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
-                'product_orders__order_id=id__orders',
-                'products__id=product_id__product_orders__order_id=id__orders'
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = config_factory([
+            'product_orders__order_id=id__orders',
+            'products__id=product_id__product_orders__order_id=id__orders'
+        ])
 
         # Should not raise exception
         config.validate()
 
-    def test_validate_fail_missing_table_coverage(self, test_base, test_models):
+    def test_validate_fail_missing_table_coverage(self, config_factory):
         """Test validation failure when table has no coverage."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
-                'product_orders__order_id=id__orders',
-                # Missing 'products' relationship - should fail
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = config_factory([
+            'product_orders__order_id=id__orders',
+            # Missing 'products' relationship - should fail
+        ])
 
         with pytest.raises(ValueError, match="The following tables lack the necessary tenant columns or a defined relationship path to tenant source .*'products'"):  # noqa
             config.validate()
 
-    def test_validate_fail_malformed_relationship_syntax(self, test_base, test_models):
-        """Test validation failure with malformed relationship syntax."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
-        # Test various malformed relationship syntaxes
-        malformed_relationships = [
-            'table1__fk=pk',  # Even number of parts
-            'table1__fk_pk__table2',  # Missing '=' in condition
-            'table1__fk=pk__',  # Incomplete join step
-            'table1____table2',  # Empty condition
-            '',  # Empty string
-        ]
+    def test_validate_missing_coverage_suggests_fk_paths(self, config_factory):
+        """Test that uncovered tables get a suggested join path along foreign keys."""
+        config = config_factory(['products__id=product_id__product_orders__order_id=id__orders'])
 
-        for malformed_rel in malformed_relationships:
-            config = TenantWiperConfig(
-                base=test_base,
-                tenant_filters=tenant_filters,
-                tenant_join_paths=[malformed_rel],
-                excluded_tables=['audit_logs', 'products', 'product_orders', 'employees', 'departments', 'companies'],
-                validate_on_init=False
-            )
+        with pytest.raises(ValueError) as exc_info:
+            config.validate()
+        assert "'product_orders': ['product_orders__order_id=id__orders']" in str(exc_info.value)
+
+    @pytest.mark.parametrize('malformed_rel', [
+        'table1__fk=pk',  # Even number of parts
+        'table1__fk_pk__table2',  # Missing '=' in condition
+        'table1__fk=pk__',  # Incomplete join step
+        'table1____table2',  # Empty condition
+        '',  # Empty string
+    ])
+    def test_validate_fail_malformed_relationship_syntax(self, config_factory, malformed_rel):
+        """Test validation failure with malformed relationship syntax."""
+        config = config_factory(
+            [malformed_rel],
+            excluded_tables=['audit_logs', 'products', 'product_orders', 'employees', 'departments', 'companies']
+        )
 
-            with pytest.raises(ValueError, match='Relationship path validation errors'):
-                config.validate()
+        with pytest.raises(ValueError, match='Relationship path validation errors'):
+            config.validate()
 
-    def test_validate_fail_nonexistent_table_in_relationship(self, test_base, test_models):
+    def test_validate_fail_nonexistent_table_in_relationship(self, config_factory):
         """Test validation failure with non-existent table in relationship."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
+        config = config_factory(
+            [
                 'nonexistent_table__id=fk__orders',  # Non-existent source table
                 'products__id=fk__nonexistent_target',  # Non-existent target table
             ],
-            excluded_tables=['audit_logs', 'product_orders', 'employees', 'departments', 'companies'],
-            validate_on_init=False
+            excluded_tables=['audit_logs', 'product_orders', 'employees', 'departments', 'companies']
         )
 
         with pytest.raises(ValueError, match='does not exist in metadata'):
             config.validate()
 
-    def test_validate_fail_nonexistent_column_in_relationship(self, test_base, test_models):
+    def test_validate_fail_nonexistent_column_in_relationship(self, config_factory):
         """Test validation failure with non-existent column in relationship."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
+        config = config_factory(
+            [
                 'products__nonexistent_col=id__orders',  # Non-existent from column
                 'products__id=nonexistent_col__orders',  # Non-existent to column
             ],
-            excluded_tables=['audit_logs', 'product_orders', 'employees', 'departments', 'companies'],
-            validate_on_init=False
+            excluded_tables=['audit_logs', 'product_orders', 'employees', 'departments', 'companies']
         )
 
         with pytest.raises(ValueError, match='does not exist in table'):
             config.validate()
 
-    def test_validate_fail_relationship_to_table_without_tenant_filter(self, test_base, test_models):
+    def test_validate_fail_relationship_to_table_without_tenant_filter(self, config_factory):
         """Test validation failure when relationship path leads to table without tenant columns."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
         # Create a relationship from product_orders to products (which has no tenant columns)
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
-                'products__id=product_id__product_orders__order_id=id__orders',
-                'product_orders__product_id=id__products',  # Leads to products (no tenant filter)
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = config_factory([
+            'products__id=product_id__product_orders__order_id=id__orders',
+            'product_orders__product_id=id__products',  # Leads to products (no tenant filter)
+        ])
 
         with pytest.raises(ValueError, match='cannot be filtered by any tenant filters'):
             config.validate()
 
-    def test_validate_fail_table_in_both_excluded_and_relationships(self, test_base, test_models):
+    def test_validate_fail_table_in_both_excluded_and_relationships(self, config_factory):
         """Test validation failure when table is in both excluded and relationships."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
-                'audit_logs__user_id=id__users',  # audit_logs is also in excluded
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],  # Same table in excluded
-            validate_on_init=False
-        )
+        config = config_factory([
+            'audit_logs__user_id=id__users',  # audit_logs is also in excluded
+        ])
 
         with pytest.raises(ValueError, match='Configuration Error.*excluded_tables.*relationships'):
             config.validate()
 
-    def test_validate_fail_circular_relationship_detection(self, test_base, test_models):
+    def test_validate_fail_circular_relationship_detection(self, config_factory):
         """Test validation handles potential circular relationships."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
         # Create a potential circular reference (though our current models don't support this)
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
-                'products__id=product_id__product_orders__order_id=user_id__users',  # Wrong column
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = config_factory([
+            'products__id=product_id__product_orders__order_id=user_id__users',  # Wrong column
+        ])
 
         with pytest.raises(ValueError, match='does not exist in table'):
             config.validate()
 
-    def test_validate_fail_complex_multi_hop_with_wrong_column(self, test_base, test_models):
+    def test_validate_fail_complex_multi_hop_with_wrong_column(self, config_factory):
         """Test validation failure in complex multi-hop relationship with wrong column."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
-                # Complex path with wrong column in the middle
-                'products__id=product_id__product_orders__wrong_column=id__orders',
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = config_factory([
+            # Complex path with wrong column in the middle
+            'products__id=product_id__product_orders__wrong_column=id__orders',
+        ])
 
         with pytest.raises(ValueError, match="Column 'wrong_column' does not exist"):
             config.validate()
 
-    def test_validate_on_init_parameter(self, test_base, test_models):
+    def test_validate_on_init_parameter(self, config_factory):
         """Test that validate_on_init=True actually validates during __init__."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
         # This should fail during __init__ because validate_on_init=True (default)
         with pytest.raises(ValueError, match='The following tables lack the necessary tenant columns or a defined relationship path to tenant source '):  # noqa
-            TenantWiperConfig(
-                base=test_base,
-                tenant_filters=tenant_filters,
-                tenant_join_paths=[
+            config_factory(
+                [
                     'product_orders__order_id=id__orders',
                     # Missing 'products' relationship
                 ],
-                excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
                 validate_on_init=True  # Explicit True
             )
 
-    def test_validate_edge_case_empty_relationships_and_filters(self, test_base, test_models):
+    def test_validate_edge_case_empty_relationships_and_filters(self, config_factory):
         """Test validation with completely empty configuration."""
-        config = TenantWiperConfig(
-            base=test_base,
+        config = config_factory(
+            [],  # No relationships
             tenant_filters=[],  # No filters
-            tenant_join_paths=[],   # No relationships
-            excluded_tables=[], # No exclusions
-            validate_on_init=False
+            excluded_tables=[],  # No exclusions
         )
 
         # Should fail because no tables have coverage
         with pytest.raises(ValueError, match='The following tables lack the necessary tenant columns or a defined relationship path to tenant source '):  # noqa
             config.validate()
 
-    def test_validate_fail_relationship_final_table_column_check(self, test_base, test_models):
+    def test_validate_fail_relationship_final_table_column_check(self, config_factory):
         """Test validation properly checks final table can be filtered by tenant filters."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),  # Only looks for tenant_id
-        ]
-
         # This should fail because products table has no tenant_id column
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
-                'product_orders__product_id=id__products',  # Final table 'products' has no tenant_id
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = config_factory([
+            'product_orders__product_id=id__products',  # Final table 'products' has no tenant_id
+        ])
 
         with pytest.raises(ValueError, match='cannot be filtered by any tenant filters.*tenant_id'):
             config.validate()
 
-    def test_validate_success_relationship_final_table_column_check(self, test_base, test_models):
+    def test_validate_success_relationship_final_table_column_check(self, config_factory):
         """Test validation passes when final table can be filtered by tenant filters."""
-        test_uuid = uuid4()
-        tenant_filters = [
-            lambda table: table.c.tenant_id == str(test_uuid),
-        ]
-
         # This should succeed because orders table has tenant_id column
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=tenant_filters,
-            tenant_join_paths=[
-                'product_orders__order_id=id__orders',  # Final table 'orders' has tenant_id
-                'products__id=product_id__product_orders__order_id=id__orders'  # Final table 'orders' has tenant_id
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = config_factory([
+            'product_orders__order_id=id__orders',  # Final table 'orders' has tenant_id
+            'products__id=product_id__product_orders__order_id=id__orders'  # Final table 'orders' has tenant_id
+        ])
 
         # Should not raise exception
         config.validate()
 
     def test_validate_tenant_filter_syntax_error(self, test_base, test_models):
         """Test that tenant filter syntax errors are properly distinguished from missing column errors."""
-        test_uuid = uuid4()
 
         # Filter with syntax error - trying to call invalid method
         def syntax_error_filter(table):
@@ -487,11 +587,11 @@ class TestTenantWiperConfig:
 
         # Filter that accesses non-existent column
         def missing_column_filter(table):
-            return table.c.nonexistent_column == str(test_uuid)
+            return table.c.nonexistent_column == _SHARED_TENANT_ID
 
         # Filter that works correctly
         def valid_filter(table):
-            return table.c.tenant_id == str(test_uuid)
+            return table.c.tenant_id == _SHARED_TENANT_ID
 
         # Test syntax error is caught and raised
         config_syntax_error = TenantWiperConfig(
@@ -552,19 +652,16 @@ class TestTenantWiperConfig:
 
         deleter = TenantDeleter(config_syntax_error)
         session, _ = test_session
-        initial_user_count = session.query(test_models['User']).count()
-        initial_order_count = session.query(test_models['Order']).count()
+        initial_user_ids = _ids(session, test_models['User'])
+        initial_order_ids = _ids(session, test_models['Order'])
 
         # Execute dry run
         with pytest.raises(Exception, match='Error binding parameter'):
             deleter.delete(session, dry_run=True, commit=False)
 
         # Verify nothing was actually deleted
-        final_user_count = session.query(test_models['User']).count()
-        final_order_count = session.query(test_models['Order']).count()
-
-        assert final_user_count == initial_user_count
-        assert final_order_count == initial_order_count
+        assert _ids(session, test_models['User']) == initial_user_ids
+        assert _ids(session, test_models['Order']) == initial_order_ids
 
         # PKs should not be collected
         assert len(deleter.pks_to_delete) == 0
@@ -589,6 +686,159 @@ class TestTenantWiperConfig:
         with pytest.raises(ValueError, match='Error on applying tenant filter'):
             config.validate()
 
+    def test_can_apply_tenant_filter_records_columns(self, test_models):
+        """Test column recording for attribute, subscript and chained operator access."""
+        users_table = test_models['User'].__table__
+        products_table = test_models['Product'].__table__
+
+        def combined_filter(table):
+            return (table.c['tenant_id'] == 'a') | table.c.org_id.in_(['b'])
+
+        assert _can_apply_tenant_filter(users_table, combined_filter) == (True, {'tenant_id', 'org_id'})
+        assert _can_apply_tenant_filter(products_table, combined_filter) == (False, {'tenant_id', 'org_id'})
+
+        # The recorder is reused between probes, earlier results must not change
+        _, first_columns = _can_apply_tenant_filter(users_table, combined_filter)
+        _can_apply_tenant_filter(users_table, lambda table: table.c.name == 'x')
+        assert first_columns == {'tenant_id', 'org_id'}
+
+    @pytest.mark.parametrize('tenant_filter', [
+        lambda table: and_(table.c.tenant_id == 'a', table.c.org_id == 'b'),
+        lambda table: or_(table.c.tenant_id == 'a', table.c.org_id.in_(['b'])),
+        lambda table: and_(func.lower(table.c.tenant_id) == 'a', func.coalesce(table.c.org_id, '') != 'b'),
+    ], ids=['and_', 'or_', 'func'])
+    def test_can_apply_tenant_filter_with_sqlalchemy_constructs(self, config_factory, test_models, tenant_filter):
+        """Test filters built with and_(), or_() and func.* are recorded and validated like operator filters."""
+        users_table = test_models['User'].__table__
+        products_table = test_models['Product'].__table__
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            assert _can_apply_tenant_filter(users_table, tenant_filter) == (True, {'tenant_id', 'org_id'})
+            assert _can_apply_tenant_filter(products_table, tenant_filter) == (False, {'tenant_id', 'org_id'})
+
+            config = config_factory(
+                ['product_orders__order_id=id__orders', 'products__id=product_id__product_orders__order_id=id__orders'],
+                tenant_filters=[tenant_filter, _default_tenant_filter]
+            )
+            config.validate()
+            # Deletion picks the filters through the same recording probe
+            assert config._get_applicable_filters(users_table) == [tenant_filter, _default_tenant_filter]
+
+    def test_filter_applicability_is_cached(self, test_base, test_models):
+        """Test that each (table, filter) pair is only probed once across validate and query build."""
+        calls = []
+
+        def counting_filter(table):
+            calls.append(table.name)
+            return table.c.tenant_id == _SHARED_TENANT_ID
+
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[counting_filter],
+            tenant_join_paths=[
+                'product_orders__order_id=id__orders',
+                'products__id=product_id__product_orders__order_id=id__orders'
+            ],
+            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False
+        )
+        config.validate()
+        calls_after_validate = len(calls)
+        assert config._applicable_filters_per_table['users'] == [counting_filter]
+        assert config._applicable_filters_per_table['products'] == []
+
+        # A full re-validation hits the cache and does not invoke the filter again
+        config._validated = False
+        config.validate()
+        assert len(calls) == calls_after_validate
+
+        # Query build reuses the filter expressions built by validate()
+        deleter = TenantDeleter(config)
+        deleter._build_pk_collection_query(test_models['Product'].__table__)
+        assert len(calls) == calls_after_validate
+        assert config._compiled_filters['products'] is None
+        assert config._compiled_filters['orders'] is not None
+
+        # Without validation expressions are built lazily, once per table where applicable
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[counting_filter],
+            tenant_join_paths=['products__id=product_id__product_orders__order_id=id__orders'],
+            validate_on_init=False
+        )
+        calls.clear()
+        deleter = TenantDeleter(config)
+        deleter._build_pk_collection_query(test_models['Product'].__table__)
+        # One column probe per table, one expression build for the applicable table
+        assert sorted(calls) == ['orders', 'orders', 'products']
+        query = deleter._build_pk_collection_query(test_models['Product'].__table__)
+        assert len(calls) == 3
+        # The built query itself is reused as well
+        assert deleter._build_pk_collection_query(test_models['Product'].__table__) is query
+
+
+    def test_filter_compile_only_during_validation(self, test_base, test_models, monkeypatch):
+        """Test that filters are compiled once per (table, filter) in validate() and never in query build."""
+        compiled = []
+        monkeypatch.setattr(
+            core, '_validate_filter_compiles', lambda table, tenant_filter: compiled.append(table.name)
+        )
+
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[lambda table: table.c.tenant_id == _SHARED_TENANT_ID],
+            tenant_join_paths=[
+                'product_orders__order_id=id__orders',
+                'products__id=product_id__product_orders__order_id=id__orders'
+            ],
+            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False
+        )
+
+        deleter = TenantDeleter(config)
+        deleter._build_pk_collection_query(test_models['Product'].__table__)
+        deleter._build_pk_collection_query(test_models['User'].__table__)
+        assert compiled == []
+
+        config.validate()
+        assert sorted(compiled) == ['orders', 'users']
+
+        config._validated = False
+        config.validate()
+        assert sorted(compiled) == ['orders', 'users']
+
+    def test_validate_runs_once(self, config_factory, monkeypatch):
+        """Test a passed validation is not repeated, a failed one is."""
+        config = config_factory(['product_orders__order_id=id__orders'])
+        with pytest.raises(ValueError, match='lack the necessary tenant columns'):
+            config.validate()
+        with pytest.raises(ValueError, match='lack the necessary tenant columns'):
+            config.validate()
+
+        config = config_factory([
+            'product_orders__order_id=id__orders',
+            'products__id=product_id__product_orders__order_id=id__orders'
+        ])
+        config.validate()
+        monkeypatch.setattr(core, '_build_columns_index', None)
+        config.validate()
+
+
+def _count_log_substrings(messages, substrings):
+    """Count the log messages containing each substring, in one pass."""
+    counts = dict.fromkeys(substrings, 0)
+    for message in messages:
+        for substring in substrings:
+            if substring in message:
+                counts[substring] += 1
+    return counts
+
+
+def _as_dict(parsed_path):
+    """Convert a parsed join path into plain dicts for comparison."""
+    return {**parsed_path._asdict(), 'steps': [step._asdict() for step in parsed_path.steps]}
+
 
 class TestJoinPathParsing:
     """Test relationship path parsing functionality."""
@@ -609,7 +859,7 @@ class TestJoinPathParsing:
             }]
         }
 
-        assert result == expected
+        assert _as_dict(result) == expected
 
     def test_parse_complex_join_path(self):
         """Test parsing a complex multi-table join path."""
@@ -635,7 +885,78 @@ class TestJoinPathParsing:
             ]
         }
 
-        assert result == expected
+        assert _as_dict(result) == expected
+
+    def test_parse_join_path_with_underscored_names(self):
+        """Test single underscores stay part of names and malformed paths keep their errors."""
+        result = _parse_join_path('order_items__order_id=id__orders')
+        assert result.start_table == 'order_items'
+        assert [step._asdict() for step in result.steps] == [{
+            'from_table': 'order_items',
+            'from_key': 'order_id',
+            'to_table': 'orders',
+            'to_key': 'id'
+        }]
+        assert _as_dict(_parse_join_path('orders')) == {'start_table': 'orders', 'final_table': 'orders', 'steps': []}
+
+        with pytest.raises(ValueError, match='odd number of parts'):
+            _parse_join_path('order_items__order_id=id')
+        with pytest.raises(ValueError, match='Invalid join condition format'):
+            _parse_join_path('order_items__order_id__orders')
+
+    def test_parse_join_path_is_cached(self):
+        """Test repeated parses return the same immutable result."""
+        first = _parse_join_path('table1__fk=pk__table2')
+        assert _parse_join_path('table1__fk=pk__table2') is first
+        with pytest.raises(AttributeError):
+            first.start_table = 'other'
+
+    def test_join_paths_parsed_once(self, test_base, test_models, monkeypatch):
+        """Test configured join paths are parsed at init and reused by validation and deletion."""
+        parsed = []
+
+        def counting_parse(path):
+            parsed.append(path)
+            return _parse_join_path(path)
+
+        monkeypatch.setattr(core, '_parse_join_path', counting_parse)
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[lambda table: table.c.tenant_id == 'target'],
+            tenant_join_paths=[
+                'product_orders__order_id=id__orders',
+                'products__id=product_id__product_orders__order_id=id__orders'
+            ],
+            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False
+        )
+        assert len(parsed) == 2
+
+        config.validate()
+        deleter = TenantDeleter(config)
+        deleter._tables_requiring_pk_snapshot()
+        deleter._build_pk_collection_query(test_models['Product'].__table__)
+        assert len(parsed) == 2
+
+
+class TestModelLookup:
+    """Test table name to model class lookup."""
+
+    def test_get_model_class_for_table(self, test_base, test_models):
+        """Test lookup by table name, including models declared after the first lookup."""
+        assert _get_model_class_for_table('orders', test_base) is test_models['Order']
+        assert _get_model_class_for_table('missing', test_base) is None
+        assert _get_model_class_for_table('orders', object()) is None
+
+        # A separate base, so the shared test schema doesn't gain a table
+        invoice_base = declarative_base()
+        assert _get_model_class_for_table('invoices', invoice_base) is None
+
+        class Invoice(invoice_base):
+            __tablename__ = 'invoices'
+            id = Column(Integer, primary_key=True)
+
+        assert _get_model_class_for_table('invoices', invoice_base) is Invoice
 
 
 class TestTenantDeleter:
@@ -668,52 +989,37 @@ class TestTenantDeleter:
         deletion_order = deleter._build_deletion_order()
 
         # Should be reversed metadata.sorted_tables
-        assert deletion_order == list(reversed(test_base.metadata.sorted_tables))
+        assert deletion_order == SORTED_TABLES_REV
+        # Computed once per config and shared between deleters
+        assert deleter._build_deletion_order() is deletion_order
+        assert TenantDeleter(config)._build_deletion_order() is deletion_order
 
 
 class TestRealDataScenarios:
     """Test scenarios with real data insertion and deletion."""
 
 
-    def test_tenant_deletion_with_real_data(self, test_session, test_base, test_models):
+    def test_tenant_deletion_with_real_data(self, test_session, test_models, default_config):
         """Test complete tenant deletion workflow with real data."""
         session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
-        other_tenant_id = tenant_data['other_tenant_id']
+        target_tenant_id = tenant_data.target_tenant_id
+        other_tenant_id = tenant_data.other_tenant_id
 
         # Verify initial data exists
-        all_users = session.query(test_models['User']).all()
-        all_orders = session.query(test_models['Order']).all()
-        all_audits = session.query(test_models['AuditLog']).all()
-
-        assert len(all_users) == 3  # 2 target + 1 other
-        assert len(all_orders) == 3  # 2 target + 1 other
-        assert len(all_audits) == 2  # Should remain after deletion
+        assert _count_rows(session, test_models['User']) == 3  # 2 target + 1 other
+        assert _count_rows(session, test_models['Order']) == 3  # 2 target + 1 other
+        assert _count_rows(session, test_models['AuditLog']) == 2  # Should remain after deletion
 
         # Count target tenant data before deletion
-        target_users = session.query(test_models['User']).filter(
-            test_models['User'].tenant_id == target_tenant_id
-        ).all()
-        target_orders = session.query(test_models['Order']).filter(
-            test_models['Order'].tenant_id == target_tenant_id
-        ).all()
+        User, Order = test_models['User'], test_models['Order']
+        target_users = _count_rows(session, User, User.tenant_id == target_tenant_id)
+        target_orders = _count_rows(session, Order, Order.tenant_id == target_tenant_id)
 
-        assert len(target_users) == 2
-        assert len(target_orders) == 2
+        assert target_users == 2
+        assert target_orders == 2
 
         # Create deletion config - need relationships for indirect tables
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=[
-                lambda table: table.c.tenant_id == target_tenant_id
-            ],
-            tenant_join_paths=[
-                'product_orders__order_id=id__orders',
-                'products__id=product_id__product_orders__order_id=id__orders'
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = default_config
 
         deleter = TenantDeleter(config)
 
@@ -721,25 +1027,22 @@ class TestRealDataScenarios:
         deleter.delete(session, dry_run=False, commit=True)
 
         # Verify target tenant data is deleted
-        remaining_users = session.query(test_models['User']).all()
-        remaining_orders = session.query(test_models['Order']).all()
-        remaining_audits = session.query(test_models['AuditLog']).all()
+        remaining_user_tenants = session.execute(select(User.tenant_id)).scalars().all()
+        remaining_order_tenants = session.execute(select(Order.tenant_id)).scalars().all()
+        remaining_audits = _count_rows(session, test_models['AuditLog'])
 
         # Should only have other tenant data remaining
-        assert len(remaining_users) == 1
-        assert remaining_users[0].tenant_id == other_tenant_id
-
-        assert len(remaining_orders) == 1
-        assert remaining_orders[0].tenant_id == other_tenant_id
+        assert remaining_user_tenants == [other_tenant_id]
+        assert remaining_order_tenants == [other_tenant_id]
 
         # Audit logs should be untouched (excluded)
-        assert len(remaining_audits) == 2
+        assert remaining_audits == 2
 
     def test_tenant_deletion_direct_no_join_explicit(self, test_session, test_base, test_models):
         """Test complete tenant deletion workflow with direct reference."""
         session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
-        other_tenant_id = tenant_data['other_tenant_id']
+        target_tenant_id = tenant_data.target_tenant_id
+        other_tenant_id = tenant_data.other_tenant_id
 
         # Create deletion config - need relationships for indirect tables
         config = TenantWiperConfig(
@@ -762,27 +1065,97 @@ class TestRealDataScenarios:
         deleter.delete(session, dry_run=False, commit=True)
 
         # Verify target tenant data is deleted
-        remaining_users = session.query(test_models['User']).all()
+        remaining_user_tenants = session.execute(select(test_models['User'].tenant_id)).scalars().all()
 
         # Should only have other tenant data remaining
-        assert len(remaining_users) == 1
-        assert remaining_users[0].tenant_id == other_tenant_id
+        assert remaining_user_tenants == [other_tenant_id]
 
 
-    def test_dry_run_reports_correctly(self, test_session, test_base, test_models):
+    def test_dry_run_reports_correctly(self, test_session, test_models, default_config):
         """Test dry run reports what would be deleted without actually deleting."""
-        session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
+        session, _ = test_session
+
+        # Rows before dry run
+        initial_user_ids = _ids(session, test_models['User'])
+        initial_order_ids = _ids(session, test_models['Order'])
+
+        config = default_config
+
+        deleter = TenantDeleter(config)
+
+        # Execute dry run
+        deleter.delete(session, dry_run=True, commit=False)
+
+        # Verify nothing was actually deleted
+        assert _ids(session, test_models['User']) == initial_user_ids
+        assert _ids(session, test_models['Order']) == initial_order_ids
+
+        # Rows are counted server side, no PKs are pulled into Python
+        assert deleter.row_counts['users'] == 2
+        assert deleter.row_counts['orders'] == 2
+        assert deleter.row_counts['product_orders'] == 3
+        # Product 1 is in both target orders and still counted once
+        assert deleter.row_counts['products'] == 2
+        assert 'DISTINCT' in str(deleter._build_count_query(default_config.base.metadata.tables['products']))
+        assert len(deleter.pks_to_delete) == 0
+
+    def test_dry_run_then_delete_with_same_deleter(self, test_session, test_models, default_config, monkeypatch):
+        """Test a real run after a dry run re-reads the rows but reuses the queries built by the dry run."""
+        session, _ = test_session
+        deleter = TenantDeleter(default_config)
+        deleter.delete(session, dry_run=True)
 
-        # Count before dry run
-        initial_user_count = session.query(test_models['User']).count()
-        initial_order_count = session.query(test_models['Order']).count()
+        composed = []
+        compose = deleter._compose_pk_collection_query
+        monkeypatch.setattr(
+            deleter, '_compose_pk_collection_query', lambda *args: composed.append(args) or compose(*args)
+        )
+        deleter.delete(session, commit=True)
+
+        # The dry run counts are not reused as PK snapshots, rows may change in between
+        assert deleter.row_counts == {}
+        assert _count_rows(session, test_models['User']) == 1
+        assert _count_rows(session, test_models['ProductOrder']) == 1
+        # Only the deduplicated PK query of the products snapshot is new, the UNION ALL variant used
+        # by the IN subquery deleting product_orders server side was already built for the dry run count
+        assert [(table.name, deduplicate) for table, deduplicate in composed] == [('products', True)]
+
+    def test_dry_run_counts_tables_in_fused_queries(self, test_session, test_base, monkeypatch, recorded_statements):
+        """Test dry run counts several tables per SELECT round-trip."""
+        session, tenant_data = test_session
+        target_tenant_id = tenant_data.target_tenant_id
 
         config = TenantWiperConfig(
             base=test_base,
-            tenant_filters=[
-                lambda table: table.c.tenant_id == target_tenant_id
+            tenant_filters=[lambda table: table.c.tenant_id == target_tenant_id],
+            tenant_join_paths=[
+                'product_orders__order_id=id__orders',
+                'products__id=product_id__product_orders__order_id=id__orders'
             ],
+            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False
+        )
+        statements = recorded_statements
+
+        deleter = TenantDeleter(config)
+        deleter.delete(session, dry_run=True)
+        assert len(statements) == 1
+
+        monkeypatch.setattr(core, '_COUNT_TABLES_PER_QUERY', 3)
+        statements.clear()
+        deleter.delete(session, dry_run=True)
+        assert len(statements) == 2
+        assert deleter.row_counts == {'users': 2, 'orders': 2, 'product_orders': 3, 'products': 2}
+
+    def test_fused_count_chunks_respect_bind_limit(self, test_session, test_base, monkeypatch, recorded_statements):
+        """Test fused dry-run counts are split so one SELECT stays under the bind parameter limit."""
+        session, tenant_data = test_session
+        tenant_ids = [tenant_data.target_tenant_id, 'other-tenant-1', 'other-tenant-2']
+        monkeypatch.setattr(core, '_MAX_BIND_PARAMS', {'sqlite': 6})
+
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[lambda table: table.c.tenant_id.in_(tenant_ids)],
             tenant_join_paths=[
                 'product_orders__order_id=id__orders',
                 'products__id=product_id__product_orders__order_id=id__orders'
@@ -790,36 +1163,60 @@ class TestRealDataScenarios:
             excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
             validate_on_init=False
         )
+        statements = recorded_statements
 
         deleter = TenantDeleter(config)
+        deleter.delete(session, dry_run=True)
 
-        # Execute dry run
-        deleter.delete(session, dry_run=True, commit=False)
+        # Each count binds the 3 expanded IN values: two tables per SELECT
+        assert len(statements) == 2
+        assert deleter.row_counts == {'users': 2, 'orders': 2, 'product_orders': 3, 'products': 2}
 
-        # Verify nothing was actually deleted
-        final_user_count = session.query(test_models['User']).count()
-        final_order_count = session.query(test_models['Order']).count()
+    def test_dry_run_compile_mode_skips_database(self, test_session, test_base, recorded_statements):
+        """Test compile-only dry run logs the DELETE statements without executing anything."""
+        session, tenant_data = test_session
+        target_tenant_id = tenant_data.target_tenant_id
 
-        assert final_user_count == initial_user_count
-        assert final_order_count == initial_order_count
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[lambda table: table.c.tenant_id == target_tenant_id],
+            tenant_join_paths=[
+                'product_orders__order_id=id__orders',
+                'products__id=product_id__product_orders__order_id=id__orders'
+            ],
+            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False
+        )
+        statements = recorded_statements
+
+        deleter = TenantDeleter(config)
+        with patch.object(session, 'execute', wraps=session.execute) as execute_spy:
+            deleter.delete(session, dry_run=True, dry_run_mode='compile')
 
-        # But PKs should have been collected
-        assert len(deleter.pks_to_delete) > 0
+        execute_spy.assert_not_called()
+        assert statements == []
+        assert sorted(deleter.dry_run_statements) == ['orders', 'product_orders', 'products', 'users']
+        assert target_tenant_id in deleter.dry_run_statements['users']
+        assert deleter.dry_run_statements['products'].startswith('DELETE FROM products')
+
+        with pytest.raises(ValueError, match='dry_run_mode must be one of'):
+            deleter.delete(session, dry_run=True, dry_run_mode='explain')
 
     def test_relationship_based_deletion(self, test_session, test_base, test_models):
         """Test deletion of tables connected via relationships."""
         session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
+        target_tenant_id = tenant_data.target_tenant_id
+
+        ProductOrder, Order = test_models['ProductOrder'], test_models['Order']
 
         # Verify initial product orders exist
-        all_product_orders = session.query(test_models['ProductOrder']).all()
-        assert len(all_product_orders) == 3
+        assert _count_rows(session, ProductOrder) == 4
 
         # Count target tenant product orders (via relationship to orders)
-        target_product_orders = session.query(test_models['ProductOrder']).join(
-            test_models['Order']
-        ).filter(test_models['Order'].tenant_id == target_tenant_id).all()
-        assert len(target_product_orders) == 2
+        target_product_orders = session.execute(
+            select(ProductOrder).join(Order).where(Order.tenant_id == target_tenant_id)
+        ).scalars().all()
+        assert len(target_product_orders) == 3
 
         config = TenantWiperConfig(
             base=test_base,
@@ -837,21 +1234,313 @@ class TestRealDataScenarios:
         deleter = TenantDeleter(config)
         deleter.delete(session, dry_run=False, commit=True)
 
-        # Verify only target tenant product orders were deleted
-        remaining_product_orders = session.query(test_models['ProductOrder']).all()
-        assert len(remaining_product_orders) == 1
+        # Verify only target tenant product orders were deleted, the remaining one belongs to other tenant
+        remaining_order_tenants = session.execute(
+            select(Order.tenant_id).select_from(ProductOrder).join(Order)
+        ).scalars().all()
+        assert len(remaining_order_tenants) == 1
+        assert remaining_order_tenants[0] != target_tenant_id
+
+    def test_server_side_deletion_with_dependent_paths(self, test_session, test_models, default_config):
+        """Test tables joined through earlier-deleted tables are snapshotted, others deleted server side."""
+        session, _ = test_session
+
+        config = default_config
+
+        deleter = TenantDeleter(config)
+        # products joins through product_orders, which is deleted before products
+        assert deleter._tables_requiring_pk_snapshot() == {'products'}
+
+        deleter.delete(session, dry_run=False, commit=True)
+
+        # Only the snapshotted table had its PKs pulled into Python
+        assert set(deleter.pks_to_delete) == {'products'}
+        assert sorted(deleter.pks_to_delete['products']) == [1, 2]
+        # Single integer PKs are packed into a 64-bit array
+        assert isinstance(deleter.pks_to_delete['products'], array.array)
+
+        remaining_product_ids = session.execute(select(test_models['Product'].id)).scalars().all()
+        assert remaining_product_ids == [3]
+        product_order = test_models['ProductOrder']
+        remaining_pos = session.execute(select(product_order.product_id, product_order.order_id)).all()
+        assert remaining_pos == [(3, 3)]
+
+    def test_pack_int_pks_falls_back_to_list_beyond_64_bits(self):
+        """Test integer PKs that overflow a 64-bit array are kept as a list of Python ints."""
+        packed = TenantDeleter._pack_int_pks([[1, 2], [3]])
+        assert isinstance(packed, array.array) and list(packed) == [1, 2, 3]
+
+        unpacked = TenantDeleter._pack_int_pks([[1], [2 ** 64, 3], [4]])
+        assert unpacked == [1, 2 ** 64, 3, 4]
+
+    def test_deletion_order_with_foreign_keys_without_cascade(self):
+        """Test deletion order and PK snapshots on a schema whose foreign keys don't cascade."""
+        # The shared test schema cascades deletes, here every child row must be deleted before its parent
+        strict_base = declarative_base()
+        users = Table(
+            'users', strict_base.metadata, Column('id', Integer, primary_key=True), Column('tenant_id', String)
+        )
+        orders = Table(
+            'orders', strict_base.metadata, Column('id', Integer, primary_key=True),
+            Column('user_id', Integer, ForeignKey('users.id')), Column('tenant_id', String)
+        )
+        products = Table('products', strict_base.metadata, Column('id', Integer, primary_key=True))
+        product_orders = Table(
+            'product_orders', strict_base.metadata,
+            Column('product_id', Integer, ForeignKey('products.id'), primary_key=True),
+            Column('order_id', Integer, ForeignKey('orders.id'), primary_key=True)
+        )
+
+        engine = create_engine('sqlite://')
+
+        @event.listens_for(engine, 'connect')
+        def enable_foreign_keys(dbapi_connection, connection_record):
+            dbapi_connection.execute('PRAGMA foreign_keys=ON')
+
+        strict_base.metadata.create_all(engine)
+        session = Session(engine)
+        session.execute(users.insert(), [{'id': 1, 'tenant_id': 'target'}, {'id': 2, 'tenant_id': 'other'}])
+        session.execute(orders.insert(), [
+            {'id': 1, 'user_id': 1, 'tenant_id': 'target'}, {'id': 2, 'user_id': 2, 'tenant_id': 'other'}
+        ])
+        session.execute(products.insert(), [{'id': 1}, {'id': 2}])
+        session.execute(
+            product_orders.insert(), [{'product_id': 1, 'order_id': 1}, {'product_id': 2, 'order_id': 2}]
+        )
+        session.commit()
+
+        config = TenantWiperConfig(
+            base=strict_base,
+            tenant_filters=[lambda table: table.c.tenant_id == 'target'],
+            tenant_join_paths=[
+                'product_orders__order_id=id__orders',
+                'products__id=product_id__product_orders__order_id=id__orders'
+            ]
+        )
+        TenantDeleter(config).delete(session, commit=True)
+
+        assert session.execute(select(users.c.id)).scalars().all() == [2]
+        assert session.execute(select(orders.c.id)).scalars().all() == [2]
+        assert session.execute(select(product_orders.c.order_id)).scalars().all() == [2]
+        # Found through the PK snapshot taken before product_orders was deleted
+        assert session.execute(select(products.c.id)).scalars().all() == [2]
+        session.close()
+        engine.dispose()
+
+    def test_subquery_delete_does_not_select_from_deleted_table(self, default_config):
+        """Test join path DELETEs start their subquery after the deleted table, which MySQL requires."""
+        deleter = TenantDeleter(default_config)
+        tables = default_config.base.metadata.tables
+
+        product_orders_sql = str(deleter._build_cascade_delete_stmt(tables['product_orders']).compile(
+            dialect=mysql.dialect()
+        ))
+        assert product_orders_sql.startswith(
+            'DELETE FROM product_orders WHERE product_orders.order_id IN (SELECT orders.id'
+        )
+        assert 'FROM product_orders' not in product_orders_sql[len('DELETE FROM product_orders'):]
+        products_sql = str(deleter._build_cascade_delete_stmt(tables['products']).compile(dialect=mysql.dialect()))
+        assert 'products.id IN (SELECT product_orders.product_id' in products_sql
+        assert 'FROM products' not in products_sql[len('DELETE FROM products'):]
+
+        # A self-referencing path reads the deleted table through a derived table
+        staff_base = declarative_base()
+        staff = Table(
+            'staff', staff_base.metadata, Column('id', Integer, primary_key=True),
+            Column('manager_id', Integer, ForeignKey('staff.id')), Column('tenant_id', String)
+        )
+        staff_config = TenantWiperConfig(
+            base=staff_base,
+            tenant_filters=[lambda table: table.c.tenant_id == 'target'],
+            tenant_join_paths=['staff__manager_id=id__staff'],
+            validate_on_init=False
+        )
+        staff_sql = str(TenantDeleter(staff_config)._build_cascade_delete_stmt(staff).compile(dialect=mysql.dialect()))
+        assert 'staff.manager_id IN (SELECT anon_1.id' in staff_sql
+
+    def test_directly_filtered_tables_deleted_without_subquery(self, test_base, test_models):
+        """Test tables with only direct tenant filters get a plain filtered DELETE."""
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[lambda table: table.c.tenant_id == 'target'],
+            tenant_join_paths=['product_orders__order_id=id__orders'],
+            validate_on_init=False
+        )
+        deleter = TenantDeleter(config)
+        tables = test_base.metadata.tables
+
+        users_sql = str(deleter._build_cascade_delete_stmt(tables['users']))
+        assert 'SELECT' not in users_sql
+        assert 'users.tenant_id' in users_sql
+        assert 'SELECT' in str(deleter._build_cascade_delete_stmt(tables['product_orders']))
+
+    def test_pk_snapshot_staged_in_temp_tables(self, test_session, test_base, test_models):
+        """Test snapshotted PKs can be staged server side in temporary tables."""
+        session, tenant_data = test_session
+        target_tenant_id = tenant_data.target_tenant_id
+
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[lambda table: table.c.tenant_id == target_tenant_id],
+            tenant_join_paths=[
+                'product_orders__order_id=id__orders',
+                'products__id=product_id__product_orders__order_id=id__orders'
+            ],
+            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False,
+            stage_pks_in_temp_tables=True
+        )
+
+        deleter = TenantDeleter(config)
+        deleter.delete(session, dry_run=False, commit=True)
+
+        assert len(deleter.pks_to_delete) == 0
+        remaining_product_ids = session.execute(select(test_models['Product'].id)).scalars().all()
+        assert remaining_product_ids == [3]
+        # Temporary tables are dropped again
+        temp_tables = session.execute(text("SELECT name FROM sqlite_temp_master WHERE type = 'table'")).all()
+        assert temp_tables == []
+
+    def test_collected_tables_without_rows_are_skipped(self, test_session, test_base, test_models):
+        """Test snapshotted tables with no matching rows get no pks_to_delete entry and delete nothing."""
+        session, _ = test_session
+
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[lambda table: table.c.tenant_id == 'unknown-tenant'],
+            tenant_join_paths=[
+                'product_orders__order_id=id__orders',
+                'products__id=product_id__product_orders__order_id=id__orders'
+            ],
+            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False
+        )
+
+        deleter = TenantDeleter(config)
+        deleter.delete(session, dry_run=False, commit=True)
+
+        assert deleter._collected_tables == {'products'}
+        assert 'products' not in deleter.pks_to_delete
+        assert _count_rows(session, test_models['Product']) == 3
+
+    def test_collected_composite_pks_deleted_in_batches(self, test_session, test_base, test_models):
+        """Test collected composite PKs are deleted in batches with an expanding IN parameter."""
+        session, _ = test_session
+
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[],
+            excluded_tables=['users', 'orders', 'products', 'audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False,
+            batch_size=1
+        )
+
+        deleter = TenantDeleter(config)
+        deleter.session = session
+        deleter.pks_to_delete['product_orders'].extend([(1, 1), (1, 2), (2, 2)])
+        deleter._execute_deletions()
+
+        product_order = test_models['ProductOrder']
+        remaining_pos = session.execute(select(product_order.product_id, product_order.order_id)).all()
+        assert remaining_pos == [(3, 3)]
+
+    def test_parallel_pk_collection_matches_serial(self, tmp_path, test_base, test_models):
+        """Test counting and PK collection on a thread pool give the same results as the serial run."""
+        engine = create_engine(f'sqlite:///{tmp_path / "tenants.db"}')
+
+        @event.listens_for(engine, 'connect')
+        def skip_fsync(dbapi_connection, connection_record):
+            # The worker threads read through their own connections, so no exclusive locking mode
+            dbapi_connection.execute('PRAGMA synchronous=OFF')
+            dbapi_connection.execute('PRAGMA journal_mode=MEMORY')
+
+        test_base.metadata.create_all(engine)
+        session = Session(engine)
+        session.execute(_INSERTS['User'], [
+            {'id': 1, 'name': 'John', 'tenant_id': 'target'},
+            {'id': 2, 'name': 'Bob', 'tenant_id': 'other'},
+        ])
+        session.execute(_INSERTS['Order'], [{'id': 1, 'user_id': 1, 'tenant_id': 'target', 'amount': 100}])
+        session.execute(_INSERTS['ProductOrder'], [{'product_id': 1, 'order_id': 1, 'quantity': 5}])
+        session.commit()
+
+        counted = []
+        collected = []
+        for parallelism in (1, 4):
+            config = TenantWiperConfig(
+                base=test_base,
+                tenant_filters=[lambda table: table.c.tenant_id == 'target'],
+                tenant_join_paths=['product_orders__order_id=id__orders'],
+                excluded_tables=['audit_logs', 'products', 'employees', 'departments', 'companies'],
+                validate_on_init=False,
+                parallelism=parallelism
+            )
+            deleter = TenantDeleter(config)
+            deleter.delete(session, dry_run=True)
+            counted.append(deleter.row_counts)
+            deleter._collect_pks_to_delete()
+            collected.append(dict(deleter.pks_to_delete))
+
+        assert counted[0] == counted[1]
+        assert counted[1]['users'] == 1
+        assert collected[0] == collected[1]
+        assert list(collected[1]['users']) == [1]
+        assert collected[1]['product_orders'] == [(1, 1)]
+        session.close()
+        engine.dispose()
+
+    def test_composite_pk_batches_respect_bind_limit(
+        self, test_session, test_base, test_models, monkeypatch, recorded_statements
+    ):
+        """Test composite key batches are shrunk so one DELETE stays under the bind parameter limit."""
+        session, _ = test_session
+        monkeypatch.setattr(core, '_MAX_BIND_PARAMS', {'sqlite': 3})
+
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[],
+            excluded_tables=['users', 'orders', 'products', 'audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False
+        )
+        statements = recorded_statements
+
+        deleter = TenantDeleter(config)
+        deleter.session = session
+        deleter.pks_to_delete['product_orders'].extend([(1, 1), (1, 2), (2, 2), (3, 3)])
+        deleter._execute_deletions()
+
+        # 2 key columns per row, 3 binds per statement: one row per DELETE
+        assert len([statement for statement in statements if statement.startswith('DELETE')]) == 4
+        assert _count_rows(session, test_models['ProductOrder']) == 0
+
+    def test_batch_size_not_capped_without_bind_limit(
+        self, test_session, test_base, test_models, monkeypatch, recorded_statements
+    ):
+        """Test the configured batch size is used as is on dialects without a bind parameter limit."""
+        session, _ = test_session
+        monkeypatch.setattr(core, '_MAX_BIND_PARAMS', {})
+
+        config = TenantWiperConfig(
+            base=test_base,
+            tenant_filters=[],
+            excluded_tables=['users', 'orders', 'products', 'audit_logs', 'employees', 'departments', 'companies'],
+            validate_on_init=False,
+            batch_size=2000
+        )
+        statements = recorded_statements
+
+        deleter = TenantDeleter(config)
+        deleter.session = session
+        deleter.pks_to_delete['product_orders'].extend([(i, i) for i in range(1, 1001)])
+        deleter._execute_deletions()
 
-        # Verify the remaining one belongs to other tenant
-        remaining_po = remaining_product_orders[0]
-        related_order = session.query(test_models['Order']).filter(
-            test_models['Order'].id == remaining_po.order_id
-        ).first()
-        assert related_order.tenant_id != target_tenant_id
+        # 2000 binds in one DELETE, above SQLite's historical limit which would otherwise split it
+        assert len([statement for statement in statements if statement.startswith('DELETE')]) == 1
 
     def test_composite_primary_key_deletion(self, test_session, test_base, test_models):
         """Test deletion of tables with composite primary keys."""
         session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
+        target_tenant_id = tenant_data.target_tenant_id
 
         config = TenantWiperConfig(
             base=test_base,
@@ -866,12 +1555,13 @@ class TestRealDataScenarios:
         )
 
         deleter = TenantDeleter(config)
+        ProductOrder = test_models['ProductOrder']
 
         # Test PK collection for composite key table
-        product_orders_table = test_models['ProductOrder'].__table__
-        query = deleter._build_pk_collection_query(product_orders_table)
+        product_orders_table = ProductOrder.__table__
+        query, is_composite = deleter._build_pk_collection_query(product_orders_table)
 
-        assert query is not None
+        assert is_composite
         # Should select both columns of composite key
         assert len(query.selected_columns) == 2
 
@@ -879,14 +1569,13 @@ class TestRealDataScenarios:
         deleter.delete(session, dry_run=False, commit=True)
 
         # Verify deletion worked correctly
-        remaining_pos = session.query(test_models['ProductOrder']).all()
-        assert len(remaining_pos) == 1
+        assert _count_rows(session, ProductOrder) == 1
 
     def test_multiple_tenant_filters(self, test_session, test_base, test_models):
         """Test deletion with multiple tenant filters (OR logic)."""
         session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
-        target_org_id = tenant_data['target_org_id']
+        target_tenant_id = tenant_data.target_tenant_id
+        target_org_id = tenant_data.target_org_id
 
         config = TenantWiperConfig(
             base=test_base,
@@ -906,182 +1595,196 @@ class TestRealDataScenarios:
         deleter.delete(session, dry_run=False, commit=True)
 
         # Should delete all users/orders with either matching tenant_id OR org_id
-        remaining_users = session.query(test_models['User']).all()
-        remaining_orders = session.query(test_models['Order']).all()
+        User, Order = test_models['User'], test_models['Order']
+        remaining_users = session.execute(select(User.tenant_id, User.org_id)).all()
+        remaining_order_tenants = set(session.execute(select(Order.tenant_id)).scalars())
 
         # Only users/orders with different tenant_id AND different org_id should remain
-        for user in remaining_users:
-            assert user.tenant_id != target_tenant_id
-            assert user.org_id != target_org_id
+        assert remaining_users
+        user_tenants, user_orgs = (set(values) for values in zip(*remaining_users))
+        assert target_tenant_id not in user_tenants and target_org_id not in user_orgs
+        assert target_tenant_id not in remaining_order_tenants
 
-        for order in remaining_orders:
-            assert order.tenant_id != target_tenant_id
-
-    def test_excluded_tables_not_touched(self, test_session, test_base, test_models):
-        """Test that excluded tables are never touched."""
+    def test_column_value_tuple_filters(self, test_session, test_base, test_models):
+        """Test `(column_name, value)` tuple filters and TenantColumnFilter, list values filter by IN."""
         session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
+        target_tenant_id = tenant_data.target_tenant_id
+        target_org_id = tenant_data.target_org_id
 
-        initial_audit_count = session.query(test_models['AuditLog']).count()
+        org_filter = TenantColumnFilter('org_id', 'in_', (target_org_id,))
+        assert str(org_filter(test_base.metadata.tables['users'])) == 'users.org_id IN (__[POSTCOMPILE_org_id_1])'
+        with pytest.raises(ValueError, match='op must be one of'):
+            TenantColumnFilter('org_id', 'like', target_org_id)
 
         config = TenantWiperConfig(
             base=test_base,
             tenant_filters=[
-                lambda table: table.c.tenant_id == target_tenant_id
+                ('tenant_id', target_tenant_id),
+                org_filter,
             ],
             tenant_join_paths=[
                 'product_orders__order_id=id__orders',
                 'products__id=product_id__product_orders__order_id=id__orders'
             ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
+            excluded_tables=['audit_logs', 'employees', 'departments', 'companies']
         )
+        assert config._get_applicable_filters(test_base.metadata.tables['orders']) == config.tenant_filters[:1]
+
+        deleter = TenantDeleter(config)
+        deleter.delete(session, dry_run=False, commit=True)
+
+        remaining_user_ids = session.execute(select(test_models['User'].id)).scalars().all()
+        assert remaining_user_ids == [3]
+        assert _count_rows(session, test_models['Product']) == 1
+
+    @pytest.mark.parametrize('tenant_filter', [('tenant_id',), ('tenant_id', 'eq', 'tenant-1')])
+    def test_tuple_filter_with_wrong_length_raises(self, test_base, tenant_filter):
+        """Test that tuple filters other than (column_name, value) raise a descriptive error."""
+        with pytest.raises(ValueError, match=r'\(column_name, value\).*TenantColumnFilter'):
+            TenantWiperConfig(base=test_base, tenant_filters=[tenant_filter], validate_on_init=False)
+
+    @pytest.mark.parametrize('value', ['tenant-1', b'tenant-1'])
+    def test_column_filter_in_rejects_string_value(self, value):
+        """Test that a string value for 'in_' raises instead of being split into characters."""
+        with pytest.raises(ValueError, match="'in_' needs a collection"):
+            TenantColumnFilter('tenant_id', 'in_', value)
+
+    def test_excluded_tables_not_touched(self, test_session, test_models, default_config):
+        """Test that excluded tables are never touched."""
+        session, _ = test_session
+
+        initial_audit_count = _count_rows(session, test_models['AuditLog'])
+
+        config = default_config
 
         deleter = TenantDeleter(config)
         deleter.delete(session, dry_run=False, commit=True)
 
         # Audit logs should be completely untouched
-        final_audit_count = session.query(test_models['AuditLog']).count()
+        final_audit_count = _count_rows(session, test_models['AuditLog'])
         assert final_audit_count == initial_audit_count
 
         # And should not appear in pks_to_delete
         assert 'audit_logs' not in deleter.pks_to_delete
 
-    def test_error_handling_with_rollback(self, test_session, test_base, test_models):
+    def test_error_handling_with_rollback(self, test_session, test_models, default_config):
         """Test error handling and rollback functionality."""
-        session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
+        session, _ = test_session
 
-        initial_user_count = session.query(test_models['User']).count()
+        initial_user_count = _count_rows(session, test_models['User'])
 
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=[
-                lambda table: table.c.tenant_id == target_tenant_id
-            ],
-            tenant_join_paths=[
-                'product_orders__order_id=id__orders',
-                'products__id=product_id__product_orders__order_id=id__orders'
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = default_config
 
         deleter = TenantDeleter(config)
 
-        # Force an error during execution by mocking session.execute to fail
-        with patch.object(session, 'execute') as mock_execute:
-            mock_execute.side_effect = Exception('Database error')
-
+        # Force an error during execution by shadowing session.execute with a failing function
+        session.execute = _raise_database_error
+        try:
             with pytest.raises(Exception, match='Database error'):
                 deleter.delete(session, dry_run=False, commit=True)
+        finally:
+            del session.execute
 
         # Verify rollback occurred - data should be unchanged
-        final_user_count = session.query(test_models['User']).count()
+        final_user_count = _count_rows(session, test_models['User'])
         assert final_user_count == initial_user_count
 
 
 class TestMockedScenarios:
     """Test scenarios that benefit from mocking."""
 
-    @patch('sqlalchemy_tenant_wiper.core.logger')
-    def test_collect_pks_logging(self, mock_logger, test_session, test_base):
+    def test_collect_pks_logging(self, caplog, test_session, default_config):
         """Test that PK collection logs appropriately."""
-        session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
+        caplog.set_level(logging.INFO, logger='sqlalchemy_tenant_wiper.core')
+        session, _ = test_session
 
-        config = TenantWiperConfig(
-            base=test_base,
-            tenant_filters=[
-                lambda table: table.c.tenant_id == target_tenant_id
-            ],
-            tenant_join_paths=[
-                'product_orders__order_id=id__orders',
-                'products__id=product_id__product_orders__order_id=id__orders'
-            ],
-            excluded_tables=['audit_logs', 'employees', 'departments', 'companies'],
-            validate_on_init=False
-        )
+        config = default_config
 
         deleter = TenantDeleter(config)
         deleter.delete(session, dry_run=True, commit=False)
 
         # Verify appropriate logging occurred
-        mock_logger.info.assert_called()
-        log_calls = [call.args[0] for call in mock_logger.info.call_args_list]
+        info_messages = [record.getMessage() for record in caplog.records if record.levelno == logging.INFO]
+        assert info_messages
+        counts = _count_log_substrings(info_messages, ('Phase', 'Collect', "' Found"))
 
         # Should log phase start/end and table processing
-        phase_logs = [log for log in log_calls if 'Phase' in log]
-        assert len(phase_logs) >= 2  # At least start and end
+        assert counts['Phase'] >= 2  # At least start and end
+        assert counts['Collect'] > 0  # Should log a collection summary
 
-        collect_logs = [log for log in log_calls if 'Collect' in log]
-        assert len(collect_logs) > 0  # Should log collection for each table
+        # Per-table results are only logged at debug level, one summary line is logged at info
+        assert counts["' Found"] == 0
+        assert '[Tenant Deleter] [Collect] Found 9 rows to delete in 4 of 4 tables' in info_messages
 
-
-class TestMultipleRelationshipPaths:
-    """Test scenarios with multiple relationship paths to the same table."""
-
-    def test_table_with_multiple_relationship_paths_current_behavior(self, test_session, test_base, test_models):
-        """Test current behavior - both path are used."""
+    def test_collect_debug_logging(self, caplog, test_session, test_base):
+        """Test per-table collection details are logged once debug logging is enabled."""
+        caplog.set_level(logging.DEBUG, logger='sqlalchemy_tenant_wiper.core')
         session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
 
-        # Configure with two different relationship paths to employees table
         config = TenantWiperConfig(
             base=test_base,
-            tenant_filters=[
-                lambda table: table.c.tenant_id == target_tenant_id
-            ],
-            tenant_join_paths=[
-                'employees__company_id=id__companies',
-                'employees__department_id=id__departments'
-            ],
-            excluded_tables=['audit_logs', 'users', 'orders', 'products', 'product_orders'],
+            tenant_filters=[lambda table: table.c.tenant_id == tenant_data.target_tenant_id],
+            tenant_join_paths=['products__id=product_id__product_orders__order_id=id__orders'],
+            excluded_tables=['audit_logs', 'employees', 'departments', 'companies', 'product_orders'],
             validate_on_init=False
         )
+        TenantDeleter(config).delete(session, dry_run=True)
+
+        debug_messages = [record.getMessage() for record in caplog.records if record.levelno == logging.DEBUG]
+        assert "[Tenant Deleter] [Collect] 'products' Found 2 rows to delete" in debug_messages
+        assert any(
+            'products.id=product_orders.product_id -> product_orders.order_id=orders.id' in message
+            for message in debug_messages
+        )
+
+
+class TestMultipleRelationshipPaths:
+    """Test scenarios with multiple relationship paths to the same table."""
+
+    def test_table_with_multiple_relationship_paths_current_behavior(
+        self, test_session, test_models, multi_path_config
+    ):
+        """Test current behavior - both path are used."""
+        session, _ = test_session
+
+        # Configured with two different relationship paths to employees table
+        config = multi_path_config
 
         # Both paths should be valid, but only one table will be stored
         assert len(config._relationship_dict) == 1
-        assert config._relationship_dict['employees'] == [
-            'employees__company_id=id__companies',
-            'employees__department_id=id__departments'
-        ]
+        assert config._relationship_dict['employees'] == list(EMPLOYEE_JOIN_PATHS)
 
         deleter = TenantDeleter(config)
         deleter.delete(session, dry_run=False, commit=True)
 
-        remaining_employees = session.query(test_models['Employee']).all()
+        remaining_employees = _count_rows(session, test_models['Employee'])
 
         # So only employees with both other_tenant_id department and companies should remain
-        assert len(remaining_employees) == 1
+        assert remaining_employees == 1
 
     def test_table_with_multiple_relationship_paths_expected_behavior(self, test_session, test_base, test_models):
         """Test expected behavior - both paths should be considered (OR logic)."""
         session, tenant_data = test_session
-        target_tenant_id = tenant_data['target_tenant_id']
+        target_tenant_id = tenant_data.target_tenant_id
 
         # This test demonstrates what the expected behavior SHOULD be
         # but will currently fail due to the bug
 
-        # Manually test what should happen with both paths
-        # Path 1: employees with target companies should be deleted
-        target_company_employees = session.query(test_models['Employee']).join(
-            test_models['Company']
-        ).filter(test_models['Company'].tenant_id == target_tenant_id).all()
+        Employee, Company, Department = test_models['Employee'], test_models['Company'], test_models['Department']
 
+        # Manually test what should happen with both paths, in one query
+        # Path 1: employees with target companies should be deleted
         # Path 2: employees with target departments should be deleted
-        target_dept_employees = session.query(test_models['Employee']).join(
-            test_models['Department']
-        ).filter(test_models['Department'].tenant_id == target_tenant_id).all()
+        target_employees = select(Employee.id).where(or_(
+            Employee.company_id.in_(select(Company.id).where(Company.tenant_id == target_tenant_id)),
+            Employee.department_id.in_(select(Department.id).where(Department.tenant_id == target_tenant_id))
+        ))
 
         # Expected: employees reachable via either path should be deleted
         # emp1: reachable via both company and department (should be deleted)
         # emp2: not reachable via either path (should remain)
         # emp3: reachable via company path only (should be deleted)
-
-        expected_to_delete = set()
-        expected_to_delete.update(emp.id for emp in target_company_employees)
-        expected_to_delete.update(emp.id for emp in target_dept_employees)
+        expected_to_delete = set(session.execute(target_employees).scalars())
 
         # Should delete emp1 and emp3 (both reachable via at least one path)
         assert expected_to_delete == {1, 3}
@@ -1089,23 +1792,28 @@ class TestMultipleRelationshipPaths:
         # This documents the expected behavior that should be implemented
         # Currently this would fail because only one path is used
 
-    def test_validation_passes_with_multiple_paths(self, test_base, test_models):
-        """Test that validation passes when multiple paths exist."""
-        target_tenant_id = str(uuid4())
-
-        # Both paths should be valid during validation
+    def test_multiple_paths_union_all_for_subquery_delete(self, test_base, test_models):
+        """Test paths are deduplicated with UNION for collection, the count query deduplicates UNION ALL itself."""
         config = TenantWiperConfig(
             base=test_base,
-            tenant_filters=[
-                lambda table: table.c.tenant_id == target_tenant_id
-            ],
-            tenant_join_paths=[
-                'employees__company_id=id__companies',     # Valid path
-                'employees__department_id=id__departments'  # Also valid path
-            ],
-            excluded_tables=['audit_logs', 'users', 'orders', 'products', 'product_orders'],
+            tenant_filters=[lambda table: table.c.tenant_id == 'target'],
+            tenant_join_paths=list(EMPLOYEE_JOIN_PATHS),
             validate_on_init=False
         )
+        deleter = TenantDeleter(config)
+        employees = test_base.metadata.tables['employees']
+
+        collect_sql = str(deleter._build_pk_collection_query(employees)[0])
+        subquery_sql = str(deleter._build_pk_collection_query(employees, deduplicate=False)[0])
+        assert 'UNION' in collect_sql and 'UNION ALL' not in collect_sql
+        assert 'UNION ALL' in subquery_sql
+
+    def test_validation_passes_with_multiple_paths(self, config_factory):
+        """Test that validation passes when multiple paths exist."""
+        # Both paths should be valid during validation. A fresh config, validate() fills its caches
+        config = config_factory(
+            list(EMPLOYEE_JOIN_PATHS), excluded_tables=['audit_logs', 'users', 'orders', 'products', 'product_orders']
+        )
 
         # Should not raise exception during validation
         config.validate()